@@ -1,19 +1,36 @@
 import os
+import atexit
+import contextlib
+import dataclasses
+import gzip
+import functools
+import hashlib
+import io
 import json
 import math
 import asyncio
+import random
 import re
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import logging
+import logging.handlers
+import queue
 
 import httpx
+import jinja2
 import requests
 from bs4 import BeautifulSoup
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
 
 # OpenAI SDK (>= 1.40)
 try:
@@ -21,6 +38,37 @@ try:
 except Exception as e:  # pragma: no cover
     OpenAI = None  # fallback for type checking
 
+# Brotli is optional; pages fall back to gzip-only precompression without it
+try:
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover
+    brotli = None
+
+# h2 is optional; the shared HTTP client falls back to HTTP/1.1 without it
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+# orjson is optional; JSON responses fall back to the stdlib encoder without it
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+# mistune is optional; BD reports are returned as Markdown only without it
+try:
+    import mistune  # type: ignore
+except Exception:  # pragma: no cover
+    mistune = None
+
+# minify-html is optional; pages are served unminified without it
+try:
+    import minify_html  # type: ignore
+except Exception:  # pragma: no cover
+    minify_html = None
+
 ###############################################
 # Environment & constants
 ###############################################
@@ -30,6 +78,9 @@ HUBSPOT_TOKEN = os.getenv("HUBSPOT_TOKEN") or os.getenv("HUBSPOT_PRIVATE_APP_TOK
 HUBSPOT_API_BASE = "https://api.hubapi.com"
 
 SERPER_API_KEY = os.getenv("SERPER_API_KEY", "")  # For web search capabilities
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "3600"))  # seconds a Serper result stays reusable
+BD_REPORT_CACHE_TTL = int(os.getenv("BD_REPORT_CACHE_TTL", "1800"))  # seconds an identical BD request reuses its report
+BRIEF_CACHE_TTL = int(os.getenv("BRIEF_CACHE_TTL", "3600"))  # seconds an identical /api/run request reuses its brief
 
 # Dynamic config and feature flags
 CURRENT_YEAR = datetime.now(timezone.utc).year
@@ -37,6 +88,18 @@ OPENAI_MODEL = os.getenv("OPENAI_MODEL", "o3-pro")  # default to best reasoning;
 STRUCTURED_OUTPUT = os.getenv("STRUCTURED_OUTPUT", "0") == "1"  # if true, ask BD model to return JSON to render
 SELF_CRITIQUE = os.getenv("SELF_CRITIQUE", "1") == "1"  # two-pass refinement ON by default for testing
 
+# /api/run routes by effort: quick briefs don't need a reasoning model or its 240s ceiling
+MODEL_BY_EFFORT = {
+    "low": os.getenv("BRIEF_MODEL_LOW", "gpt-4o-mini"),
+    "medium": os.getenv("BRIEF_MODEL_MEDIUM", "gpt-4o"),
+    "high": OPENAI_MODEL,
+}
+TIMEOUT_BY_EFFORT = {"low": 60.0, "medium": 120.0, "high": 240.0}
+
+def _is_reasoning_model(model: str) -> bool:
+    """o-series (and gpt-5) models take reasoning effort and reject temperature."""
+    return model.startswith(("o1", "o3", "o4", "gpt-5"))
+
 if not OPENAI_API_KEY:
     # We'll raise at runtime if someone actually calls the endpoint, but keep server booting.
     pass
@@ -62,9 +125,16 @@ file_handler.setLevel(logging.INFO)
 formatter = logging.Formatter('%(asctime)s | %(message)s')
 file_handler.setFormatter(formatter)
 
+# Request handlers only enqueue records; a listener thread does the blocking file
+# writes so log_usage never stalls the event loop on disk I/O
+usage_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+usage_log_listener = logging.handlers.QueueListener(usage_log_queue, file_handler)
+
 # Add handler to logger
 if not usage_logger.handlers:
-    usage_logger.addHandler(file_handler)
+    usage_logger.addHandler(logging.handlers.QueueHandler(usage_log_queue))
+    usage_log_listener.start()
+    atexit.register(usage_log_listener.stop)
 
 def log_usage(event_type: str, data: Dict[str, Any], request: Request = None):
     """Log usage events for analysis."""
@@ -257,7 +327,7 @@ Quality check (perform silently):
 """
 
 BD_DEFAULT_PROMPT = """
-Create a strategic business development intelligence report using the research provided below.
+Create a strategic business development intelligence report using the research provided.
 Focus on identifying specific opportunities where Cro Metrics can drive measurable business impact through our comprehensive digital growth services.
 
 CRITICAL: Map the target company's specific needs and challenges to Cro Metrics' current service offerings listed in the system context above. Reference our proven results ($1B client impact, 97.4% retention rate, 10X ROI) and relevant client success stories when applicable.
@@ -469,6 +539,15 @@ def _extract_tool_calls(resp: Any) -> List[Dict[str, Any]]:
         calls.append({"id": call_id, "name": name, "arguments": args})
     return calls
 
+def _has_tool_calls(resp: Any) -> bool:
+    """Whether a Responses API result ended by calling tools, in either output shape."""
+    if _extract_tool_calls(resp):
+        return True
+    return any(
+        (item.get("type") if isinstance(item, dict) else getattr(item, "type", None)) == "function_call"
+        for item in getattr(resp, "output", []) or []
+    )
+
 # === Critique pass (two-step refinement) ===
 BD_CRITIQUE_DEV_MESSAGE = """
 You are the BD Report Critic & Rewriter for Cro Metrics.
@@ -490,7 +569,53 @@ Constraints: Use only the provided draft and research context; do NOT invent fac
 ###############################################
 # FastAPI app
 ###############################################
-app = FastAPI(title="Executive Meeting Brief Generator", version="1.0.0")
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for the dataclasses orjson serializes natively."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when it's installed (much faster on report payloads)."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return json.dumps(
+                content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default
+            ).encode("utf-8")
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+# One pooled client for Slack, HubSpot, Serper and scraping so keep-alive
+# connections (and TLS sessions) are reused instead of rebuilt per call
+_http: Optional[httpx.AsyncClient] = None
+
+def _http_client() -> httpx.AsyncClient:
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global _http
+    _http_client()
+    try:
+        yield
+    finally:
+        if _http is not None:
+            await _http.aclose()
+            _http = None
+
+app = FastAPI(
+    title="Executive Meeting Brief Generator",
+    version="1.0.0",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -500,6 +625,22 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+class _GZipMiddleware(GZipMiddleware):
+    """Starlette's GZipMiddleware, except it leaves responses alone for clients that send gzip;q=0."""
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            if _accepted_encodings(accept_encoding).get("gzip") == 0:
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+# Compresses JSON reports and the streamed /api/run markdown (flushed per chunk, so
+# streaming still works). Pages and static assets are precompressed and already carry
+# Content-Encoding, so the middleware passes them through; SSE is excluded by Starlette.
+app.add_middleware(_GZipMiddleware, minimum_size=1024)
+
 ###############################################
 # Utilities
 ###############################################
@@ -511,8 +652,80 @@ def _openai_client() -> Any:
         raise HTTPException(status_code=400, detail="OPENAI_API_KEY not configured")
     return OpenAI(api_key=OPENAI_API_KEY)
 
+def _sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message."""
+    encoded = orjson.dumps(data).decode() if orjson is not None else json.dumps(data, default=_json_default)
+    return f"event: {event}\ndata: {encoded}\n\n"
+
+class _TTLCache:
+    """Small in-process LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> int:
+        count = len(self._data)
+        self._data.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class _RateLimiter:
+    """Spaces out call starts so no more than `rate` begin per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+def _cache_key(*parts: str) -> str:
+    """Stable digest of the inputs that determine a cached model response."""
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+# Scraped snippets and free-text fields have no natural limit; capping each one keeps
+# the model context (and with it cost and reasoning time) bounded
+SNIPPET_MAX_CHARS = 400
+TITLE_MAX_CHARS = 120
+
+def _clip(text: str, limit: int = SNIPPET_MAX_CHARS) -> str:
+    """Truncate text to at most limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
 # Simple in-memory caches for this process lifetime
 _user_cache: Dict[str, Dict[str, Any]] = {}
+_search_cache = _TTLCache(maxsize=2048, ttl=SEARCH_CACHE_TTL)
+_bd_report_cache = _TTLCache(maxsize=64, ttl=BD_REPORT_CACHE_TTL)
+_brief_cache = _TTLCache(maxsize=512, ttl=BRIEF_CACHE_TTL)
+# HubSpot email lookups; short TTL, and dropped whenever we create contacts ourselves
+_contacts_cache = _TTLCache(maxsize=256, ttl=300)
 
 async def _sleep_for_retry(resp: httpx.Response) -> None:
     if resp.status_code == 429:
@@ -532,18 +745,18 @@ async def slack_call(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
     if not SLACK_TOKEN:
         raise HTTPException(status_code=400, detail="Slack token not configured")
     headers = {"Authorization": f"Bearer {SLACK_TOKEN}"}
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        url = f"{SLACK_API_BASE}/{method}"
-        while True:
-            resp = await client.get(url, params=params, headers=headers)
-            if resp.status_code == 429:
-                await _sleep_for_retry(resp)
-                continue
-            data = resp.json()
-            if not data.get("ok"):
-                # Return early for visibility; include a snippet of error
-                raise HTTPException(status_code=400, detail=f"Slack error in {method}: {data.get('error')}")
-            return data
+    client = _http_client()
+    url = f"{SLACK_API_BASE}/{method}"
+    while True:
+        resp = await client.get(url, params=params, headers=headers)
+        if resp.status_code == 429:
+            await _sleep_for_retry(resp)
+            continue
+        data = resp.json()
+        if not data.get("ok"):
+            # Return early for visibility; include a snippet of error
+            raise HTTPException(status_code=400, detail=f"Slack error in {method}: {data.get('error')}")
+        return data
 
 async def list_channels(limit: int = 200) -> List[Dict[str, Any]]:
     params = {
@@ -670,20 +883,55 @@ async def fetch_channel_context(
 # HubSpot helpers
 ###############################################
 
+# HubSpot allows ~10 requests/second per portal; parallel attendee research would
+# otherwise burst past that and spend longer in 429 retries than it saved
+HUBSPOT_MAX_RETRIES = 4
+_hubspot_concurrency = asyncio.Semaphore(8)
+_hubspot_rate = _RateLimiter(10)
+
+# Personal mailboxes never match a company contact, so looking them up only spends
+# HubSpot filter slots and API units
+PERSONAL_DOMAINS = frozenset({"gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com"})
+
+_HUBSPOT_INTERNED_PROPS = ("lifecyclestage", "company")
+
+def _hubspot_lookup_emails(emails: List[str]) -> List[str]:
+    """Lowercased, de-duplicated corporate addresses worth searching HubSpot for."""
+    eligible: Dict[str, None] = {}
+    for e in emails:
+        e = (e or "").strip().lower()
+        if "@" in e and e.split("@", 1)[1] not in PERSONAL_DOMAINS:
+            eligible[e] = None
+    return list(eligible)
+
+def _hubspot_retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Honour Retry-After when HubSpot sends it, else exponential backoff with jitter."""
+    try:
+        return min(float(resp.headers["Retry-After"]), 30.0)
+    except (KeyError, ValueError):
+        return min(0.5 * 2 ** attempt + random.random() * 0.5, 30.0)
+
 async def hubspot_post(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     if not HUBSPOT_TOKEN:
         # Make this non-fatal; the app can run without HubSpot if needed
         raise HTTPException(status_code=400, detail="HubSpot token not configured")
     headers = {"Authorization": f"Bearer {HUBSPOT_TOKEN}", "Content-Type": "application/json"}
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(f"{HUBSPOT_API_BASE}{path}", json=payload, headers=headers)
+    client = _http_client()
+    for attempt in range(HUBSPOT_MAX_RETRIES + 1):
+        async with _hubspot_concurrency:
+            await _hubspot_rate.acquire()
+            resp = await client.post(f"{HUBSPOT_API_BASE}{path}", json=payload, headers=headers)
+        if resp.status_code == 429 and attempt < HUBSPOT_MAX_RETRIES:
+            # Sleep outside the semaphore so other calls keep their slots while we back off
+            await asyncio.sleep(_hubspot_retry_delay(resp, attempt))
+            continue
         if resp.status_code >= 400:
             raise HTTPException(status_code=400, detail=f"HubSpot error: {resp.text[:300]}")
         return resp.json()
 
 async def fetch_contacts_by_email(emails: List[str]) -> List[Dict[str, Any]]:
-    """Look up each email individually via CRM Search. Expects a custom contact property
-    'linkedin_url' (type URL). Returns a simplified list of properties for each found contact.
+    """Look up emails in batches of 100 via the contacts batch/read endpoint. Expects a custom contact
+    property 'linkedin_url' (type URL). Returns a simplified list of properties for each found contact.
     """
     results: List[Dict[str, Any]] = []
     props = [
@@ -696,17 +944,33 @@ async def fetch_contacts_by_email(emails: List[str]) -> List[Dict[str, Any]]:
         "linkedin_url",
         "hs_object_id",
     ]
-    for email in {e.strip().lower() for e in emails if e and e.strip()}:
-        payload = {
-            "filterGroups": [{"filters": [{"propertyName": "email", "operator": "EQ", "value": email}]}],
+    unique_emails = sorted({e.strip().lower() for e in emails if e and e.strip()})
+    cache_key = tuple(unique_emails)
+    cached = _contacts_cache.get(cache_key)
+    if cached is not None:
+        return [dict(c) for c in cached]
+    # batch/read takes up to 100 emails per call and, unlike the search endpoint, isn't held to
+    # the lower search rate limit or index lag; unknown emails just come back under "errors"
+    batches = await asyncio.gather(*(
+        hubspot_post("/crm/v3/objects/contacts/batch/read", {
+            "idProperty": "email",
+            "inputs": [{"id": e} for e in unique_emails[i:i + 100]],
             "properties": props,
-            "limit": 1,
-        }
-        data = await hubspot_post("/crm/v3/objects/contacts/search", payload)
+        })
+        for i in range(0, len(unique_emails), 100)
+    ))
+    for data in batches:
         for row in data.get("results", []):
             props_row = row.get("properties", {})
-            props_row["_id"] = row.get("id")
+            props_row["id"] = row.get("id")
+            # A handful of lifecycle stages and company names repeat across every row;
+            # interning lets cached contacts share one copy of each
+            for key in _HUBSPOT_INTERNED_PROPS:
+                value = props_row.get(key)
+                if value:
+                    props_row[key] = sys.intern(value)
             results.append(props_row)
+    _contacts_cache.set(cache_key, [dict(c) for c in results])
     return results
 
 async def search_hubspot_contact_by_name(name: str, company: str = "") -> Optional[Dict[str, Any]]:
@@ -781,13 +1045,13 @@ async def search_hubspot_contact_by_name(name: str, company: str = "") -> Option
                         result_company = result.get("properties", {}).get("company", "")
                         if company.lower() in result_company.lower() or result_company.lower() in company.lower():
                             props_row = result.get("properties", {})
-                            props_row["_id"] = result.get("id")
+                            props_row["id"] = result.get("id")
                             return props_row
                 
                 # Otherwise return the first match
                 contact = results[0]
                 props_row = contact.get("properties", {})
-                props_row["_id"] = contact.get("id")
+                props_row["id"] = contact.get("id")
                 return props_row
         
         return None
@@ -818,37 +1082,39 @@ async def find_hubspot_contact(name: str, email: str = "", company: str = "") ->
 # BD Research helpers
 ###############################################
 
+# Request pieces that are identical for every search, built once at import
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+SERPER_HEADERS = {"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"}
+
 async def web_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]:
     """Perform web search using Serper API (Google Search)."""
     if not SERPER_API_KEY:
         return [{"title": "Web search unavailable", "snippet": "SERPER_API_KEY not configured", "link": ""}]
+
+    # Repeat research for the same person/company issues identical queries; reuse them
+    cache_key = (" ".join(query.lower().split()), num_results)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
     
-    headers = {
-        "X-API-KEY": SERPER_API_KEY,
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "q": query,
-        "num": num_results
-    }
+    payload = {"q": query, "num": num_results}
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post("https://google.serper.dev/search", 
-                                       json=payload, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                results = []
-                for item in data.get("organic", []):
-                    results.append({
-                        "title": item.get("title", ""),
-                        "snippet": item.get("snippet", ""),
-                        "link": item.get("link", "")
-                    })
-                return results
-            else:
-                return [{"title": "Search error", "snippet": f"API returned {response.status_code}", "link": ""}]
+        client = _http_client()
+        response = await client.post(SERPER_SEARCH_URL, json=payload, headers=SERPER_HEADERS)
+        if response.status_code == 200:
+            data = response.json()
+            results = []
+            for item in data.get("organic", []):
+                results.append({
+                    "title": item.get("title", ""),
+                    "snippet": item.get("snippet", ""),
+                    "link": item.get("link", "")
+                })
+            _search_cache.set(cache_key, results)
+            return list(results)
+        else:
+            return [{"title": "Search error", "snippet": f"API returned {response.status_code}", "link": ""}]
     except Exception as e:
         return [{"title": "Search failed", "snippet": str(e), "link": ""}]
 
@@ -859,38 +1125,38 @@ async def scrape_webpage(url: str) -> Dict[str, str]:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-            response = await client.get(url)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+        client = _http_client()
+        response = await client.get(url, headers=headers)
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, 'html.parser')
                 
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
                 
-                # Get text content
-                text = soup.get_text()
+            # Get text content
+            text = soup.get_text()
                 
-                # Clean up text
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
+            # Clean up text
+            lines = (line.strip() for line in text.splitlines())
+            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+            text = ' '.join(chunk for chunk in chunks if chunk)
                 
-                # Truncate if too long
-                if len(text) > 5000:
-                    text = text[:5000] + "... [truncated]"
+            # Truncate if too long
+            if len(text) > 5000:
+                text = text[:5000] + "... [truncated]"
                 
-                return {
-                    "title": soup.title.string if soup.title else "No title",
-                    "content": text,
-                    "url": url
-                }
-            else:
-                return {
-                    "title": "Error",
-                    "content": f"Failed to fetch content: HTTP {response.status_code}",
-                    "url": url
-                }
+            return {
+                "title": soup.title.string if soup.title else "No title",
+                "content": text,
+                "url": url
+            }
+        else:
+            return {
+                "title": "Error",
+                "content": f"Failed to fetch content: HTTP {response.status_code}",
+                "url": url
+            }
     except Exception as e:
         return {
             "title": "Error",
@@ -1025,6 +1291,26 @@ async def research_attendee_background(name: str, company_name: str, title: str
     
     return research_data
 
+def _hubspot_contact_properties(attendee_data: Dict[str, Any]) -> Dict[str, str]:
+    """HubSpot contact properties for an attendee."""
+    name = attendee_data.get("name", "")
+    email = attendee_data.get("email", "")
+    properties = {
+        "firstname": name.split()[0] if name else "",
+        "lastname": " ".join(name.split()[1:]) if name and len(name.split()) > 1 else "",
+        "jobtitle": attendee_data.get("title", ""),
+        "company": attendee_data.get("company", ""),
+    }
+    
+    # Add email if available
+    if email:
+        properties["email"] = email
+    
+    # Add LinkedIn URL if available
+    if attendee_data.get("linkedin_url"):
+        properties["linkedin_url"] = attendee_data["linkedin_url"]
+    return properties
+
 async def create_hubspot_contact(attendee_data: Dict[str, Any]) -> Optional[str]:
     """Create a new contact in HubSpot after checking for duplicates."""
     if not HUBSPOT_TOKEN:
@@ -1039,49 +1325,175 @@ async def create_hubspot_contact(attendee_data: Dict[str, Any]) -> Optional[str]
         existing_contact = await find_hubspot_contact(name, email, company)
         if existing_contact:
             # Return existing contact ID instead of creating duplicate
-            return existing_contact.get("_id") or existing_contact.get("id")
-        
-        properties = {
-            "firstname": name.split()[0] if name else "",
-            "lastname": " ".join(name.split()[1:]) if name and len(name.split()) > 1 else "",
-            "jobtitle": attendee_data.get("title", ""),
-            "company": company,
-        }
-        
-        # Add email if available
-        if email:
-            properties["email"] = email
+            return existing_contact.get("id")
         
-        # Add LinkedIn URL if available
-        if attendee_data.get("linkedin_url"):
-            properties["linkedin_url"] = attendee_data["linkedin_url"]
-        
-        payload = {"properties": properties}
+        payload = {"properties": _hubspot_contact_properties(attendee_data)}
         
         response = await hubspot_post("/crm/v3/objects/contacts", payload)
+        _contacts_cache.clear()
         return response.get("id")
         
     except Exception:
         return None
 
+def _contact_match_key(properties: Dict[str, Any]) -> Tuple[str, str, str]:
+    return tuple(
+        (properties.get(k) or "").strip().lower() for k in ("email", "firstname", "lastname")
+    )
+
+async def create_hubspot_contacts(attendees: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """Create many contacts via HubSpot's batch/create (100 per call), reusing existing ones.
+    Returns contact IDs in input order, None where creation failed.
+    """
+    contact_ids: List[Optional[str]] = [None] * len(attendees)
+    if not HUBSPOT_TOKEN:
+        return contact_ids
+
+    # Same duplicate check as create_hubspot_contact, with emails looked up in one search
+    contacts_by_email = await _prefetch_contacts_by_email(attendees) or {}
+
+    async def existing_contact(attendee: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        contact = contacts_by_email.get((attendee.get("email") or "").strip().lower())
+        if contact:
+            return contact
+        try:
+            return await search_hubspot_contact_by_name(attendee.get("name", ""), attendee.get("company", ""))
+        except Exception:
+            return None
+
+    existing = await asyncio.gather(*(existing_contact(a) for a in attendees))
+    to_create = []
+    for i, contact in enumerate(existing):
+        if contact:
+            contact_ids[i] = contact.get("id")
+        else:
+            to_create.append(i)
+
+    for start in range(0, len(to_create), 100):
+        chunk = to_create[start:start + 100]
+        inputs = [{"properties": _hubspot_contact_properties(attendees[i])} for i in chunk]
+        try:
+            data = await hubspot_post("/crm/v3/objects/contacts/batch/create", {"inputs": inputs})
+            _contacts_cache.clear()
+        except Exception as e:
+            # One invalid input fails the whole batch; create the chunk one by one instead
+            print(f"HubSpot batch create failed, falling back to single creates: {e}")
+            created = await asyncio.gather(*(create_hubspot_contact(attendees[i]) for i in chunk))
+            for i, contact_id in zip(chunk, created):
+                contact_ids[i] = contact_id
+            continue
+        # Batch results aren't guaranteed to come back in input order
+        created_ids: Dict[Tuple[str, str, str], List[str]] = {}
+        for row in data.get("results", []):
+            created_ids.setdefault(_contact_match_key(row.get("properties", {})), []).append(row.get("id"))
+        for i, item in zip(chunk, inputs):
+            matches = created_ids.get(_contact_match_key(item["properties"]))
+            if matches:
+                contact_ids[i] = matches.pop(0)
+    return contact_ids
+
+# Caps attendee lookups in flight across all requests so Serper/HubSpot aren't flooded
+_attendee_research_limit = asyncio.Semaphore(8)
+
+async def _prefetch_contacts_by_email(attendees_data: List[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Batch-fetch HubSpot contacts for every attendee email, indexed by lowercase email.
+    Returns None when nothing was prefetched so callers fall back to per-attendee lookups.
+    """
+    if not HUBSPOT_TOKEN:
+        return None
+    attendee_emails = [a.get("email") for a in attendees_data if a.get("email")]
+    if not attendee_emails:
+        return None
+    try:
+        hubspot_contacts = await fetch_contacts_by_email(attendee_emails)
+    except Exception:
+        return None
+    return {(c.get("email") or "").lower(): c for c in hubspot_contacts}
+
+async def _enrich_attendee(
+    name: str,
+    title: str,
+    email: str,
+    company: str,
+    contacts_by_email: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """HubSpot match, LinkedIn discovery and background research for a single attendee."""
+    async with _attendee_research_limit:
+        enriched_attendee = {
+            "name": name,
+            "title": title,
+            "company": company,
+            "email": email,
+            "linkedin_url": None,
+            "linkedin_snippet": None,
+            "linkedin_title": None,
+            "hubspot_contact": None,
+            "background_research": None
+        }
+
+        # Check if this attendee exists in HubSpot; emails were already batch-fetched when
+        # contacts_by_email is given, so only the name search is left to do per attendee
+        if contacts_by_email is not None:
+            hubspot_contact = contacts_by_email.get(email.lower()) if email else None
+            if not hubspot_contact:
+                hubspot_contact = await search_hubspot_contact_by_name(name, company)
+        else:
+            hubspot_contact = await find_hubspot_contact(name, email, company)
+        if hubspot_contact:
+            enriched_attendee["hubspot_contact"] = hubspot_contact
+            enriched_attendee["linkedin_url"] = hubspot_contact.get("linkedin_url")
+
+        # LinkedIn discovery if not already found in HubSpot
+        if not enriched_attendee["linkedin_url"]:
+            linkedin_data = await research_attendee_linkedin(name, company, title)
+            enriched_attendee["linkedin_url"] = linkedin_data.get("url")
+            enriched_attendee["linkedin_snippet"] = linkedin_data.get("snippet")
+            enriched_attendee["linkedin_title"] = linkedin_data.get("title")
+
+        # Background research
+        background_data = await research_attendee_background(
+            name, company, title, enriched_attendee["linkedin_url"] or ""
+        )
+        enriched_attendee["background_research"] = background_data
+
+        return enriched_attendee
+
 ###############################################
 # OpenAI (o3) call
 ###############################################
 
-async def ask_o3(user_prompt: str, composed_context: str, effort: str = "high") -> str:
-    client = _openai_client()
-    request_params = {
-        "model": OPENAI_MODEL,
-        "reasoning": {"effort": effort},
+def _o3_request_params(
+    user_prompt: str, composed_context: str, effort: str, model: Optional[str] = None
+) -> Dict[str, Any]:
+    """Responses API parameters shared by the blocking and streaming brief calls."""
+    model = model or OPENAI_MODEL
+    request_params: Dict[str, Any] = {
+        "model": model,
+        # Static instructions, then the meeting context, then the user's prompt: regenerating
+        # with a tweaked prompt re-sends an identical prefix that OpenAI can serve from cache
         "input": [
             {"role": "developer", "content": DEV_MESSAGE},
-            {"role": "user", "content": user_prompt + "\n\n" + composed_context},
+            {"role": "user", "content": composed_context},
+            {"role": "user", "content": user_prompt},
         ],
         "max_output_tokens": 4000,
+        "prompt_cache_key": "mtgprep-brief",
     }
-    # o3-pro doesn't support temperature parameter
-    if OPENAI_MODEL != "o3-pro":
+    if _is_reasoning_model(model):
+        request_params["reasoning"] = {"effort": effort}
+    else:
         request_params["temperature"] = 0.2
+    return request_params
+
+# Shown in place of a report or brief when the model returns no text; never cached
+NO_TEXT_OUTPUT = "(No text output received from model)"
+
+async def ask_o3(
+    user_prompt: str, composed_context: str, effort: str = "high", model: Optional[str] = None
+) -> Optional[str]:
+    """The brief's Markdown, or None when the model produced no text."""
+    client = _openai_client()
+    request_params = _o3_request_params(user_prompt, composed_context, effort, model)
     
     resp = client.responses.create(**request_params)
     # The SDK exposes a convenience property; fall back if not present.
@@ -1107,31 +1519,91 @@ async def ask_o3(user_prompt: str, composed_context: str, effort: str = "high")
                 elif isinstance(c, dict):
                     if c.get("type") == "output_text" and c.get("text"):
                         parts.append(c["text"])            
-        return "".join(parts) or json.dumps(resp.model_dump() if hasattr(resp, "model_dump") else resp, indent=2)
+        if parts:
+            return "".join(parts)
+        # Keep the raw response for debugging, but out of the brief (and so out of the cache)
+        print("No text output in model response: " + json.dumps(resp.model_dump() if hasattr(resp, "model_dump") else resp))
     except Exception:
-        return "(No text output received from model)"
+        pass
+    return None
 
-async def ask_o3_bd(
-    user_prompt: str,
-    research_context: str,
-    effort: str = "high",
-    structured: Optional[bool] = None,
-    critique: Optional[bool] = None,
-    enable_tools: bool = True,
-) -> str:
-    """BD-specific version of OpenAI call with optional tool calling and structured output (JSON Schema rendered to Markdown)."""
+async def _stream_response_events(request_params: Dict[str, Any]) -> AsyncIterator[Any]:
+    """Create a streaming Responses API call and yield its events."""
     client = _openai_client()
-    use_structured = STRUCTURED_OUTPUT if structured is None else structured
-    use_critique = SELF_CRITIQUE if critique is None else critique
+    # The SDK client is synchronous, so both the request and the event iteration run in the threadpool
+    stream = await run_in_threadpool(client.responses.create, stream=True, **request_params)
+    async for event in iterate_in_threadpool(stream):
+        yield event
+
+async def ask_o3_stream(
+    user_prompt: str, composed_context: str, effort: str = "high", model: Optional[str] = None
+) -> AsyncIterator[str]:
+    """Yield brief text deltas as the Responses API streams them."""
+    request_params = _o3_request_params(user_prompt, composed_context, effort, model)
+    async for event in _stream_response_events(request_params):
+        if getattr(event, "type", "") == "response.output_text.delta" and event.delta:
+            yield event.delta
+
+async def _with_deadline(chunks: AsyncIterator[str], timeout: float) -> AsyncIterator[str]:
+    """Re-yield an async stream, raising asyncio.TimeoutError once the overall deadline passes."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        try:
+            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=remaining)
+        except StopAsyncIteration:
+            return
+        yield chunk
+
+def _collect_response_text(r: Any) -> str:
+    """Text of a finished Responses API result, assembled from content parts if needed."""
+    text = getattr(r, "output_text", None)
+    if isinstance(text, str) and text.strip():
+        return text
+    parts: List[str] = []
+    for item in getattr(r, "output", []) or []:
+        # Handle both dict-like and object-like items
+        content_list = []
+        if hasattr(item, 'content'):
+            content_list = item.content or []
+        elif isinstance(item, dict):
+            content_list = item.get("content", []) or []
+
+        for c in content_list:
+            # Handle both dict-like and object-like content items
+            if hasattr(c, 'type') and hasattr(c, 'text'):
+                if c.type in ("output_text", "message_text") and c.text:
+                    parts.append(c.text)
+            elif isinstance(c, dict):
+                if c.get("type") in ("output_text", "message_text") and c.get("text"):
+                    parts.append(c["text"])
+    return "".join(parts)
+
+def _bd_prompt_cache_key(research_context: str) -> str:
+    """Routes requests that share a research context to the same OpenAI prompt cache."""
+    return "bd-" + hashlib.sha256(research_context.encode("utf-8")).hexdigest()[:32]
 
+def _bd_request_kwargs(
+    user_prompt: str,
+    research_context: str,
+    effort: str,
+    use_structured: bool,
+    enable_tools: bool,
+) -> Dict[str, Any]:
+    """Responses API parameters for the first BD report pass."""
     request_kwargs: Dict[str, Any] = {
         "model": OPENAI_MODEL,
         "reasoning": {"effort": effort},
+        # Research context before the user's instructions: editing the prompt keeps the cached prefix
         "input": [
             {"role": "developer", "content": BD_DEV_MESSAGE},
-            {"role": "user", "content": user_prompt + "\n\n" + research_context},
+            {"role": "user", "content": research_context},
+            {"role": "user", "content": user_prompt},
         ],
         "max_output_tokens": 6000,
+        "prompt_cache_key": _bd_prompt_cache_key(research_context),
     }
     # o3-pro doesn't support temperature parameter
     if OPENAI_MODEL != "o3-pro":
@@ -1143,6 +1615,46 @@ async def ask_o3_bd(
         }
     if enable_tools:
         request_kwargs["tools"] = BD_TOOLS
+    return request_kwargs
+
+def _bd_critique_md_params(first_text: str, research_context: str, effort: str) -> Dict[str, Any]:
+    """Responses API parameters for the Markdown critique pass over a draft BD report."""
+    critique_params: Dict[str, Any] = {
+        "model": OPENAI_MODEL,
+        "reasoning": {"effort": effort},
+        "input": [
+            {"role": "developer", "content": CRITIQUE_MD_DEV_MESSAGE},
+            {"role": "user", "content": "RESEARCH_CONTEXT:\n" + research_context},
+            {"role": "user", "content":
+                "Rewrite and improve the following draft while staying within the given research context.\n\n"
+                "DRAFT_MARKDOWN:\n" + (first_text or "")
+            }
+        ],
+        "max_output_tokens": 6000,
+        "prompt_cache_key": _bd_prompt_cache_key(research_context),
+    }
+    # o3-pro doesn't support temperature parameter
+    if OPENAI_MODEL != "o3-pro":
+        critique_params["temperature"] = 0.2
+    return critique_params
+
+async def ask_o3_bd(
+    user_prompt: str,
+    research_context: str,
+    effort: str = "high",
+    structured: Optional[bool] = None,
+    critique: Optional[bool] = None,
+    enable_tools: bool = True,
+) -> Optional[str]:
+    """BD-specific version of OpenAI call with optional tool calling and structured output (JSON Schema rendered to Markdown).
+
+    Returns None when the model produced no text.
+    """
+    client = _openai_client()
+    use_structured = STRUCTURED_OUTPUT if structured is None else structured
+    use_critique = SELF_CRITIQUE if critique is None else critique
+
+    request_kwargs = _bd_request_kwargs(user_prompt, research_context, effort, use_structured, enable_tools)
 
     # 1) Initial create using responses API - no fallback, let errors surface
     resp = client.responses.create(**request_kwargs)
@@ -1173,38 +1685,17 @@ async def ask_o3_bd(
             pass
 
     # 3) Extract first draft from responses API
-    def _collect_text(r: Any) -> str:
-        text = getattr(r, "output_text", None)
-        if isinstance(text, str) and text.strip():
-            return text
-        parts: List[str] = []
-        for item in getattr(r, "output", []) or []:
-            # Handle both dict-like and object-like items
-            content_list = []
-            if hasattr(item, 'content'):
-                content_list = item.content or []
-            elif isinstance(item, dict):
-                content_list = item.get("content", []) or []
-                
-            for c in content_list:
-                # Handle both dict-like and object-like content items
-                if hasattr(c, 'type') and hasattr(c, 'text'):
-                    if c.type in ("output_text", "message_text") and c.text:
-                        parts.append(c.text)
-                elif isinstance(c, dict):
-                    if c.get("type") in ("output_text", "message_text") and c.get("text"):
-                        parts.append(c["text"])
-        return "".join(parts)
-
-    first_text = _collect_text(resp)
+    first_text = _collect_response_text(resp)
 
     # 4) If structured, try to parse JSON and optionally run critique pass
     if use_structured:
+        if not first_text:
+            return None
         try:
-            first_doc = json.loads(first_text) if first_text else {}
+            first_doc = json.loads(first_text)
         except Exception:
             # If JSON parse fails, just return raw text
-            return first_text or "(No text output received from model)"
+            return first_text
 
         if use_critique and using_responses_api:
             # Two-pass critique only works with responses API
@@ -1214,13 +1705,14 @@ async def ask_o3_bd(
                     "reasoning": {"effort": effort},
                     "input": [
                         {"role": "developer", "content": BD_CRITIQUE_DEV_MESSAGE},
+                        {"role": "user", "content": "RESEARCH_CONTEXT:\n" + research_context},
                         {"role": "user", "content":
                             "Improve the following draft BD report JSON while preserving schema and evidence.\n\n"
-                            "DRAFT_JSON:\n" + json.dumps(first_doc) + "\n\n"
-                            "RESEARCH_CONTEXT:\n" + research_context
+                            "DRAFT_JSON:\n" + json.dumps(first_doc)
                         }
                     ],
                     "max_output_tokens": 6000,
+                    "prompt_cache_key": _bd_prompt_cache_key(research_context),
                     "response_format": {
                         "type": "json_schema",
                         "json_schema": {"name": "bd_intel_report", "schema": BD_REPORT_SCHEMA},
@@ -1230,7 +1722,7 @@ async def ask_o3_bd(
                 if OPENAI_MODEL != "o3-pro":
                     critique_req["temperature"] = 0.2
                 improved = client.responses.create(**critique_req)
-                improved_text = _collect_text(improved)
+                improved_text = _collect_response_text(improved)
                 try:
                     improved_doc = json.loads(improved_text) if improved_text else {}
                     return _bd_json_to_markdown(improved_doc)
@@ -1246,1575 +1738,371 @@ async def ask_o3_bd(
 
     # 5) Non-structured path: optional critique to improve Markdown quality
     if use_critique:
-        critique_params = {
-            "model": OPENAI_MODEL,
-            "reasoning": {"effort": effort},
-            "input": [
-                {"role": "developer", "content": CRITIQUE_MD_DEV_MESSAGE},
-                {"role": "user", "content":
-                    "Rewrite and improve the following draft while staying within the given research context.\n\n"
-                    "DRAFT_MARKDOWN:\n" + (first_text or "") + "\n\n"
-                    "RESEARCH_CONTEXT:\n" + research_context
-                }
-            ],
-            "max_output_tokens": 6000,
-        }
-        # o3-pro doesn't support temperature parameter
-        if OPENAI_MODEL != "o3-pro":
-            critique_params["temperature"] = 0.2
-            
+        critique_params = _bd_critique_md_params(first_text, research_context, effort)
         improved = client.responses.create(**critique_params)
-        improved_text = _collect_text(improved)
-        return improved_text or (first_text or "(No text output received from model)")
+        improved_text = _collect_response_text(improved)
+        return improved_text or first_text or None
 
-    return first_text or "(No text output received from model)"
+    return first_text or None
 
-###############################################
-# HTML front-end (simple, self-contained)
-###############################################
+async def ask_o3_bd_stream(
+    user_prompt: str,
+    research_context: str,
+    effort: str = "high",
+    structured: Optional[bool] = None,
+    critique: Optional[bool] = None,
+    enable_tools: bool = True,
+) -> AsyncIterator[str]:
+    """Streaming counterpart of ask_o3_bd: yields the report Markdown as it is generated, or nothing
+    when the model produced no text."""
+    use_structured = STRUCTURED_OUTPUT if structured is None else structured
+    use_critique = SELF_CRITIQUE if critique is None else critique
 
-INDEX_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-  <title>Executive Meeting Brief Generator</title>
-  <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;500;600;800&family=Caveat:wght@400;700&display=swap" rel="stylesheet">
-  <style>
-    :root {
-      /* CroMetrics Design Tokens */
-      --cro-blue-800: #0F8AFF;
-      --cro-blue-700: #2996FF;
-      --cro-blue-500: #399EFF;
-      --cro-blue-400: #61B1FF;
-      --cro-blue-200: #9CCEFF;
-      --cro-blue-100: #E0F0FF;
-      --cro-green-700: #509A6A;
-      --cro-green-600: #56A471;
-      --cro-green-500: #57A773;
-      --cro-green-400: #79B98F;
-      --cro-green-200: #ABD3B9;
-      --cro-green-100: #DEEDE3;
-      --cro-purple-800: #484D6D;
-      --cro-purple-700: #6D718A;
-      --cro-purple-400: #A3A6B6;
-      --cro-plat-400: #D5DDD9;
-      --cro-plat-300: #E3E8E6;
-      --cro-plat-100: #F4F6F5;
-      --cro-yellow-700: #C7870A;
-      --cro-yellow-600: #F5B841;
-      --cro-yellow-500: #F7C667;
-      --cro-yellow-400: #FADCA0;
-      --cro-yellow-100: #FCEDCF;
-      --cro-red-600: #EB0000;
-      --cro-red-500: #FF0000;
-      --cro-red-300: #FFD6D6;
-      --cro-soft-black-700: #2F2B2F;
-      --cro-white: #FFFFFF;
-      --radius: 1.5rem;
-    }
+    if use_structured:
+        # Structured reports are rendered from the finished JSON document, so they arrive in one piece
+        text = await ask_o3_bd(user_prompt, research_context, effort, True, use_critique, enable_tools)
+        if text:
+            yield text
+        return
 
-    body{
-      font-family: 'Montserrat', system-ui, -apple-system, sans-serif;
-      margin: 0;
-      padding: 2rem;
-      background: var(--cro-plat-100);
-      color: var(--cro-soft-black-700);
-      font-size: 16px;
-      line-height: 1.6;
-    }
+    if use_critique:
+        # Only the critique pass reaches the reader, so the draft is produced without streaming
+        first_text = await ask_o3_bd(user_prompt, research_context, effort, False, False, enable_tools)
+        if not first_text:
+            return
+        streamed = False
+        async for event in _stream_response_events(_bd_critique_md_params(first_text, research_context, effort)):
+            if getattr(event, "type", "") == "response.output_text.delta" and event.delta:
+                streamed = True
+                yield event.delta
+        if not streamed:
+            yield first_text
+        return
+
+    request_kwargs = _bd_request_kwargs(user_prompt, research_context, effort, False, enable_tools)
+    streamed = False
+    final = None
+    async for event in _stream_response_events(request_kwargs):
+        event_type = getattr(event, "type", "")
+        if event_type == "response.output_text.delta" and event.delta:
+            streamed = True
+            yield event.delta
+        elif event_type == "response.completed":
+            final = getattr(event, "response", None)
+    if not streamed and enable_tools and final is not None and _has_tool_calls(final):
+        # The model answered with tool calls instead of text; the tool loop only runs on the
+        # non-streaming path, so produce the report there rather than ending empty
+        text = await ask_o3_bd(user_prompt, research_context, effort, False, False, enable_tools)
+        if text:
+            yield text
+        return
+    if not streamed and final is not None:
+        text = _collect_response_text(final)
+        if text:
+            yield text
 
-    .nav-header {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-bottom: 2rem;
-    }
+###############################################
+# HTML front-end (templates/)
+###############################################
 
-    .nav-links {
-      display: flex;
-      gap: 1rem;
-    }
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+PAGE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+ASSET_MEDIA_TYPES = {"js": "text/javascript; charset=utf-8", "css": "text/css; charset=utf-8"}
+# Assets are addressed as <stem>.<content hash>.<ext>, e.g. /static/app.1a2b3c4d5e6f.js
+_HASHED_ASSET_RE = re.compile(r"^(?P<stem>[\w-]+)\.(?P<digest>[0-9a-f]{12})\.(?P<ext>js|css)$")
+
+# Pages are static, so the environment compiles each template once and never re-stats the files
+_TEMPLATES = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+    cache_size=-1,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
 
-    .nav-links a {
-      font-family: 'Montserrat', sans-serif;
-      font-weight: 600;
-      text-decoration: none;
-      color: var(--cro-blue-700);
-      padding: 0.5rem 1rem;
-      border-radius: 8px;
-      transition: all 0.2s;
-    }
 
-    .nav-links a:hover {
-      background: var(--cro-blue-100);
-    }
+def _render_page(name: str, **context: Any) -> str:
+    """Render one of the front-end templates."""
+    return _TEMPLATES.get_template(name).render(**context)
 
-    .nav-links a.active {
-      background: var(--cro-blue-700);
-      color: var(--cro-white);
-    }
 
-    h1{
-      font-family: 'Montserrat', sans-serif;
-      font-weight: 800;
-      font-size: 2.5rem;
-      color: var(--cro-soft-black-700);
-      margin: 0;
-      text-align: center;
-    }
+def _minify(html: str) -> str:
+    """Strip whitespace/comments and minify inline CSS/JS when minify-html is installed."""
+    if minify_html is None:
+        return html
+    return minify_html.minify(
+        html,
+        minify_css=True,
+        minify_js=True,
+        keep_closing_tags=True,
+        keep_html_and_head_opening_tags=True,
+    )
 
-    label{
-      font-family: 'Montserrat', sans-serif;
-      display: block;
-      font-weight: 600;
-      margin: 1rem 0 0.5rem 0;
-      color: var(--cro-soft-black-700);
-      font-size: 0.9rem;
-      text-transform: uppercase;
-      letter-spacing: 0.05em;
-    }
+def _precompress(text: str) -> Dict[str, bytes]:
+    """Encode a static page or asset once and keep gzip/brotli variants alongside the raw bytes."""
+    body = text.encode("utf-8")
+    variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return variants
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): accepts lists, W/ tags and "*"."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == bare
+        for candidate in if_none_match.split(",")
+    )
 
-    select, input, textarea{
-      font-family: 'Montserrat', sans-serif;
-      font-size: 1rem;
-      padding: 0.75rem 1rem;
-      border: 1px solid var(--cro-plat-300);
-      border-radius: 12px;
-      background: var(--cro-white);
-      color: var(--cro-soft-black-700);
-      transition: all 0.2s;
-      width: 100%;
-      box-sizing: border-box;
-    }
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Content codings in an Accept-Encoding header mapped to their q-values (RFC 9110 §12.5.3)."""
+    accepted: Dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+def _negotiated_response(
+    request: Request,
+    etag: str,
+    variants: Dict[str, bytes],
+    media_type: str,
+    cache_control: str,
+) -> Response:
+    """Serve the best precompressed variant the client accepts, or 304 if its copy is current."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    wildcard = accepted.get("*")
+    best, best_q = "identity", 0.0
+    # Highest q-value wins; on ties the order here (smallest variant first) decides
+    for encoding in ("br", "gzip", "identity"):
+        if encoding not in variants:
+            continue
+        q = accepted.get(encoding, wildcard)
+        if q is None:
+            # Unlisted codings are refused, except identity which is always acceptable
+            q = 1.0 if encoding == "identity" else 0.0
+        if q > best_q:
+            best, best_q = encoding, q
+    # Even a client that refuses identity gets it when nothing else is acceptable
+    if best != "identity":
+        headers["Content-Encoding"] = best
+    return Response(variants[best], media_type=media_type, headers=headers)
+
+@functools.lru_cache(maxsize=None)
+def _static_asset(name: str) -> Tuple[str, str, Dict[str, bytes]]:
+    """Load a static asset once and return its content-hashed filename, ETag and encoded variants."""
+    with open(os.path.join(STATIC_DIR, name), "r", encoding="utf-8") as f:
+        variants = _precompress(f.read())
+    digest = hashlib.md5(variants["identity"]).hexdigest()
+    stem, ext = name.rsplit(".", 1)
+    return f"{stem}.{digest[:12]}.{ext}", f'"{digest}"', variants
+
+def _asset_url(name: str) -> str:
+    """Versioned URL for a static asset; changes whenever the file's content does."""
+    return "/static/" + _static_asset(name)[0]
+
+_TEMPLATES.globals["asset_url"] = _asset_url
+
+@functools.lru_cache(maxsize=None)
+def _page_variants(name: str, page: str) -> Tuple[str, Dict[str, bytes]]:
+    """Render, minify and compress a page on its first request; later requests reuse the bytes."""
+    variants = _precompress(_minify(_render_page(name, page=page)))
+    etag = '"' + hashlib.md5(variants["identity"]).hexdigest() + '"'
+    return etag, variants
+
+def _serve_page(request: Request, name: str, page: str) -> Response:
+    """Serve a rendered page with revalidation-only caching."""
+    etag, variants = _page_variants(name, page)
+    return _negotiated_response(request, etag, variants, "text/html; charset=utf-8", PAGE_CACHE_CONTROL)
 
-    select:focus, input:focus, textarea:focus{
-      outline: none;
-      border-color: var(--cro-blue-700);
-      box-shadow: 0 0 0 3px var(--cro-blue-100);
-    }
+###############################################
+# Routes
+###############################################
 
-    textarea{
-      width: 100%;
-      min-height: 160px;
-      resize: vertical;
-      font-family: 'Montserrat', sans-serif;
-      line-height: 1.5;
-    }
+@app.get("/", response_class=HTMLResponse)
+async def index(request: Request) -> Response:
+    return _serve_page(request, "index.html", "index")
 
-    button{
-      font-family: 'Montserrat', sans-serif;
-      font-weight: 600;
-      font-size: 1rem;
-      padding: 0.75rem 2rem;
-      border: none;
-      border-radius: var(--radius);
-      background: var(--cro-blue-700);
-      color: var(--cro-white);
-      cursor: pointer;
-      transition: all 0.2s;
-      box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }
+@app.get("/api/channels")
+async def api_channels() -> JSONResponse:
+    channels = await list_channels(limit=400)
+    # Filter for channels starting with "bd-" or "internal-" and exclude archived
+    filtered_channels = [
+        c for c in channels 
+        if not c.get("is_archived", False) and 
+        c.get("name", "").startswith(("bd-", "internal-"))
+    ]
+    # Trim the payload for UI
+    result = [
+        {"id": c.get("id"), "name": c.get("name"), "is_private": bool(c.get("is_private"))}
+        for c in filtered_channels
+    ]
+    # Short private cache lets the page's preloaded response satisfy loadChannels()
+    return ORJSONResponse({"channels": result}, headers={"Cache-Control": "private, max-age=60"})
 
-    button:hover{
-      background: var(--cro-blue-800);
-      transform: translateY(-1px);
-      box-shadow: 0 2px 6px rgba(0,0,0,0.15);
-    }
+@app.get("/bd", response_class=HTMLResponse)
+async def bd_index(request: Request) -> Response:
+    return _serve_page(request, "bd_index.html", "bd")
+
+@app.get("/static/{filename}")
+async def static_asset(request: Request, filename: str) -> Response:
+    match = _HASHED_ASSET_RE.match(filename)
+    name = f"{match['stem']}.{match['ext']}" if match else ""
+    if not name or not os.path.isfile(os.path.join(STATIC_DIR, name)):
+        raise HTTPException(status_code=404, detail="Not found")
+    hashed_name, etag, variants = _static_asset(name)
+    # A stale hash (page cached from a previous deploy) still gets the current file, just not immutably
+    cache_control = ASSET_CACHE_CONTROL if hashed_name == filename else "no-cache"
+    return _negotiated_response(request, etag, variants, ASSET_MEDIA_TYPES[match["ext"]], cache_control)
+
+def _bd_attendee_inputs(payload: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split a BD request into pre-researched attendees or raw attendees to research inline."""
+    # Handle both old format and new researched attendees format
+    researched_attendees = payload.get("researched_attendees", [])
+    if researched_attendees:
+        # New workflow: use pre-researched attendees
+        return researched_attendees, []
 
-    button:active{
-      transform: translateY(0);
-    }
+    # Legacy workflow: research attendees inline (backwards compatibility)
+    attendees_data = payload.get("attendees", [])
+    if not attendees_data:
+        # Fallback to old format for backwards compatibility
+        executive_name = (payload.get("executive_name") or "").strip()
+        executive_title = (payload.get("executive_title") or "").strip()
+        if executive_name:
+            attendees_data = [{"name": executive_name, "title": executive_title, "email": ""}]
 
-    button[disabled]{
-      opacity: 0.5;
-      cursor: not-allowed;
-      transform: none;
-    }
+    if not attendees_data:
+        raise HTTPException(status_code=400, detail="At least one attendee is required")
+    return [], attendees_data
 
-    .row{
-      display: flex;
-      gap: 1.5rem;
-      flex-wrap: wrap;
-      align-items: flex-end;
-      margin-bottom: 1rem;
-    }
-
-    .row > div{
-      flex: 1;
-      min-width: 250px;
-      display: flex;
-      flex-direction: column;
-    }
-
-    .card{
-      background: var(--cro-white);
-      border: 1px solid var(--cro-plat-300);
-      border-radius: var(--radius);
-      padding: 2rem;
-      margin: 1rem 0;
-      box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }
-
-    #out{
-      background: var(--cro-white);
-      border: 1px solid var(--cro-plat-300);
-      padding: 2rem;
-      border-radius: var(--radius);
-      line-height: 1.6;
-      font-family: 'Montserrat', sans-serif;
-      box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-      margin-top: 2rem;
-    }
-
-    #out h1, #out h2, #out h3{
-      font-family: 'Montserrat', sans-serif;
-      margin-top: 2rem;
-      margin-bottom: 1rem;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out h1{
-      font-size: 2rem;
-      font-weight: 800;
-      border-bottom: 2px solid var(--cro-plat-300);
-      padding-bottom: 0.75rem;
-      color: var(--cro-blue-700);
-    }
-
-    #out h2{
-      font-size: 1.5rem;
-      font-weight: 700;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out h3{
-      font-size: 1.25rem;
-      font-weight: 600;
-      color: var(--cro-purple-700);
-    }
-
-    #out p{
-      margin: 1rem 0;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out ul, #out ol{
-      margin: 1rem 0;
-      padding-left: 2rem;
-    }
-
-    #out li{
-      margin: 0.5rem 0;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out strong{
-      font-weight: 700;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out code{
-      background: var(--cro-plat-100);
-      padding: 0.25rem 0.5rem;
-      border-radius: 6px;
-      font-family: 'Monaco', 'Menlo', monospace;
-      font-size: 0.9rem;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out pre{
-      background: var(--cro-plat-100);
-      padding: 1.5rem;
-      border-radius: 12px;
-      overflow-x: auto;
-      margin: 1.5rem 0;
-      border: 1px solid var(--cro-plat-300);
-    }
-
-    #out blockquote{
-      border-left: 4px solid var(--cro-blue-400);
-      padding-left: 1.5rem;
-      margin: 1.5rem 0;
-      font-style: italic;
-      color: var(--cro-purple-700);
-    }
-
-    .muted{
-      color: var(--cro-purple-400);
-      font-size: 0.875rem;
-      font-family: 'Montserrat', sans-serif;
-    }
-
-    /* Responsive Design */
-    @media (max-width: 768px) {
-      body { 
-        padding: 1rem; 
-      }
-      
-      .row { 
-        flex-direction: column; 
-        gap: 1rem; 
-      }
-      
-      .row > div { 
-        min-width: auto; 
-      }
-      
-      h1 { 
-        font-size: 2rem; 
-      }
-      
-      .card {
-        padding: 1.5rem;
-      }
-    }
-  </style>
-</head>
-<body>
-  <div class="nav-header">
-    <h1>Executive Meeting Brief Generator</h1>
-    <div class="nav-links">
-      <a href="/" class="active">Internal Meetings</a>
-      <a href="/bd">BD Meetings</a>
-    </div>
-  </div>
-  <div class="card">
-    <div class="row">
-      <div>
-        <label for="channel">Slack channel</label>
-        <select id="channel"></select>
-      </div>
-      <div>
-        <label for="limit">Max messages</label>
-        <input id="limit" type="number" value="300" min="20" max="1000" />
-      </div>
-      <div>
-        <label for="days">Lookback days</label>
-        <input id="days" type="number" value="14" min="1" max="90" />
-      </div>
-      <div>
-        <label for="effort">Reasoning effort</label>
-        <select id="effort">
-          <option value="high" selected>high</option>
-          <option value="medium">medium</option>
-          <option value="low">low</option>
-        </select>
-      </div>
-    </div>
-
-    <div class="row">
-      <div>
-        <label for="attendees">Attendee emails (comma-separated)</label>
-        <input id="attendees" type="text" placeholder="alex@client.com, pat@client.com" />
-        <div class="muted" style="margin-top: 0.5rem;">HubSpot Private App token must be set to enrich attendees; otherwise this is ignored.</div>
-      </div>
-      <div>
-        <label for="purpose">Meeting purpose</label>
-        <input id="purpose" type="text" placeholder="Discovery for Q4 upsell" />
-      </div>
-    </div>
-
-    <label for="prompt">Instruction to the model</label>
-    <textarea id="prompt">Create an executive meeting brief that satisfies the Developer spec above.
-Use the ATTENDEES, ACCOUNT CONTEXT, and RECENT SLACK provided. Prioritize what's actionable in the next 14 days.
-Base every claim on the given context; if not present, mark as **Unknown**. Offer at most one labeled assumption when necessary.
-Cite Slack evidence inline as `[ISO8601Z @name]` when helpful. End with the Validation Checklist.</textarea>
-
-    <div class="row" style="margin-top: 1.5rem;">
-      <button id="run">Run</button>
-      <div id="status" class="muted" style="align-self: center; margin-left: 1rem;"></div>
-    </div>
-  </div>
-
-  <h3 style="margin-top: 2rem; margin-bottom: 1rem; font-family: 'Montserrat', sans-serif; color: var(--cro-soft-black-700);">Output</h3>
-  <div id="out">(result will appear here)</div>
-
-  <script>
-    const channelSel = document.getElementById('channel');
-    const out = document.getElementById('out');
-    const statusEl = document.getElementById('status');
-
-    function parseMarkdown(text) {
-      // Simple markdown parser to avoid regex escaping issues
-      let lines = text.split('\\n');
-      let html = [];
-      let inList = false;
-      
-      for (let line of lines) {
-        if (line.startsWith('### ')) {
-          html.push('<h3>' + line.substring(4) + '</h3>');
-        } else if (line.startsWith('## ')) {
-          html.push('<h2>' + line.substring(3) + '</h2>');
-        } else if (line.startsWith('# ')) {
-          html.push('<h1>' + line.substring(2) + '</h1>');
-        } else if (line.startsWith('- ') || line.startsWith('* ')) {
-          if (!inList) {
-            html.push('<ul>');
-            inList = true;
-          }
-          html.push('<li>' + line.substring(2) + '</li>');
-        } else if (line.match(/^\\d+\\. /)) {
-          if (!inList) {
-            html.push('<ol>');
-            inList = true;
-          }
-          html.push('<li>' + line.replace(/^\\d+\\. /, '') + '</li>');
-        } else {
-          if (inList) {
-            html.push('</ul>');
-            inList = false;
-          }
-          if (line.trim()) {
-            line = line.replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>');
-            line = line.replace(/\\*(.*?)\\*/g, '<em>$1</em>');
-            line = line.replace(/`(.*?)`/g, '<code>$1</code>');
-            html.push('<p>' + line + '</p>');
-          }
-        }
-      }
-      if (inList) html.push('</ul>');
-      return html.join('');
-    }
-
-    async function loadChannels(){
-      statusEl.textContent = 'Loading Slack channels…';
-      console.log('Starting to load channels...');
-      console.log('channelSel element:', channelSel);
-      try{
-        const r = await fetch('/api/channels');
-        console.log('Fetch response status:', r.status, r.ok);
-        if(!r.ok){ throw new Error(await r.text()); }
-        const data = await r.json();
-        console.log('Channels data received:', data);
-        channelSel.innerHTML = '';
-        data.channels.forEach(c => {
-          const opt = document.createElement('option');
-          opt.value = c.id;
-          opt.textContent = (c.is_private ? '🔒 ' : '# ') + (c.name || c.id);
-          channelSel.appendChild(opt);
-        });
-        console.log('Added', data.channels.length, 'channels to dropdown');
-        statusEl.textContent = '';
-      }catch(e){
-        console.error('Channel loading error:', e);
-        statusEl.textContent = 'Failed to load channels: ' + (e && e.message ? e.message : e);
-      }
-    }
-
-    async function run(){
-      out.textContent = '';
-      statusEl.textContent = 'Running…';
-      document.getElementById('run').disabled = true;
-      try{
-        const body = {
-          channel_id: document.getElementById('channel').value,
-          limit: parseInt(document.getElementById('limit').value||'300',10),
-          lookback_days: parseInt(document.getElementById('days').value||'14',10),
-          effort: document.getElementById('effort').value,
-          resolve_names: true,
-          prompt: document.getElementById('prompt').value,
-          attendee_emails: document.getElementById('attendees').value,
-          purpose: document.getElementById('purpose').value,
-        };
-        const r = await fetch('/api/run', {method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify(body)});
-        const data = await r.json();
-        if(!r.ok){ throw new Error(data.detail || JSON.stringify(data)); }
-        statusEl.textContent = 'Done.';
-        const markdown = data.brief_markdown || '(no output)';
-        out.innerHTML = parseMarkdown(markdown);
-      }catch(e){
-        statusEl.textContent = 'Error: ' + (e && e.message ? e.message : e);
-      }finally{
-        document.getElementById('run').disabled = false;
-      }
-    }
-
-    document.getElementById('run').addEventListener('click', run);
-    loadChannels();
-  </script>
-</body>
-</html>
-"""
-
-BD_INDEX_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-  <title>BD Meeting Intelligence Generator</title>
-  <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;500;600;800&family=Caveat:wght@400;700&display=swap" rel="stylesheet">
-  <style>
-    :root {
-      /* CroMetrics Design Tokens */
-      --cro-blue-800: #0F8AFF;
-      --cro-blue-700: #2996FF;
-      --cro-blue-500: #399EFF;
-      --cro-blue-400: #61B1FF;
-      --cro-blue-200: #9CCEFF;
-      --cro-blue-100: #E0F0FF;
-      --cro-green-700: #509A6A;
-      --cro-green-600: #56A471;
-      --cro-green-500: #57A773;
-      --cro-green-400: #79B98F;
-      --cro-green-200: #ABD3B9;
-      --cro-green-100: #DEEDE3;
-      --cro-purple-800: #484D6D;
-      --cro-purple-700: #6D718A;
-      --cro-purple-400: #A3A6B6;
-      --cro-plat-400: #D5DDD9;
-      --cro-plat-300: #E3E8E6;
-      --cro-plat-100: #F4F6F5;
-      --cro-yellow-700: #C7870A;
-      --cro-yellow-600: #F5B841;
-      --cro-yellow-500: #F7C667;
-      --cro-yellow-400: #FADCA0;
-      --cro-yellow-100: #FCEDCF;
-      --cro-red-600: #EB0000;
-      --cro-red-500: #FF0000;
-      --cro-red-300: #FFD6D6;
-      --cro-soft-black-700: #2F2B2F;
-      --cro-white: #FFFFFF;
-      --radius: 1.5rem;
-    }
-
-    body{
-      font-family: 'Montserrat', system-ui, -apple-system, sans-serif;
-      margin: 0;
-      padding: 2rem;
-      background: var(--cro-plat-100);
-      color: var(--cro-soft-black-700);
-      font-size: 16px;
-      line-height: 1.6;
-    }
-
-    .nav-header {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-bottom: 2rem;
-    }
-
-    .nav-links {
-      display: flex;
-      gap: 1rem;
-    }
-
-    .nav-links a {
-      font-family: 'Montserrat', sans-serif;
-      font-weight: 600;
-      text-decoration: none;
-      color: var(--cro-blue-700);
-      padding: 0.5rem 1rem;
-      border-radius: 8px;
-      transition: all 0.2s;
-    }
-
-    .nav-links a:hover {
-      background: var(--cro-blue-100);
-    }
-
-    .nav-links a.active {
-      background: var(--cro-blue-700);
-      color: var(--cro-white);
-    }
-
-    h1{
-      font-family: 'Montserrat', sans-serif;
-      font-weight: 800;
-      font-size: 2.5rem;
-      color: var(--cro-soft-black-700);
-      margin: 0;
-      text-align: center;
-    }
-
-    label{
-      font-family: 'Montserrat', sans-serif;
-      display: block;
-      font-weight: 600;
-      margin: 1rem 0 0.5rem 0;
-      color: var(--cro-soft-black-700);
-      font-size: 0.9rem;
-      text-transform: uppercase;
-      letter-spacing: 0.05em;
-    }
-
-    select, input, textarea{
-      font-family: 'Montserrat', sans-serif;
-      font-size: 1rem;
-      padding: 0.75rem 1rem;
-      border: 1px solid var(--cro-plat-300);
-      border-radius: 12px;
-      background: var(--cro-white);
-      color: var(--cro-soft-black-700);
-      transition: all 0.2s;
-      width: 100%;
-      box-sizing: border-box;
-    }
-
-    select:focus, input:focus, textarea:focus{
-      outline: none;
-      border-color: var(--cro-blue-700);
-      box-shadow: 0 0 0 3px var(--cro-blue-100);
-    }
-
-    textarea{
-      width: 100%;
-      min-height: 120px;
-      resize: vertical;
-      font-family: 'Montserrat', sans-serif;
-      line-height: 1.5;
-    }
-
-    button{
-      font-family: 'Montserrat', sans-serif;
-      font-weight: 600;
-      font-size: 1rem;
-      padding: 0.75rem 2rem;
-      border: none;
-      border-radius: var(--radius);
-      background: var(--cro-blue-700);
-      color: var(--cro-white);
-      cursor: pointer;
-      transition: all 0.2s;
-      box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }
-
-    button:hover{
-      background: var(--cro-blue-800);
-      transform: translateY(-1px);
-      box-shadow: 0 2px 6px rgba(0,0,0,0.15);
-    }
-
-    button:active{
-      transform: translateY(0);
-    }
-
-    button[disabled]{
-      opacity: 0.5;
-      cursor: not-allowed;
-      transform: none;
-    }
-
-    button.secondary{
-      background: var(--cro-plat-300);
-      color: var(--cro-soft-black-700);
-      font-size: 0.9rem;
-      padding: 0.5rem 1rem;
-    }
-
-    button.secondary:hover{
-      background: var(--cro-plat-400);
-    }
-
-    button.remove{
-      background: var(--cro-red-500);
-      color: var(--cro-white);
-      font-size: 0.8rem;
-      padding: 0.4rem 0.8rem;
-      margin-left: 0.5rem;
-    }
-
-    button.remove:hover{
-      background: var(--cro-red-600);
-    }
-
-    .row{
-      display: flex;
-      gap: 1.5rem;
-      flex-wrap: wrap;
-      align-items: flex-end;
-      margin-bottom: 1rem;
-    }
-
-    .row > div{
-      flex: 1;
-      min-width: 250px;
-      display: flex;
-      flex-direction: column;
-    }
-
-    .card{
-      background: var(--cro-white);
-      border: 1px solid var(--cro-plat-300);
-      border-radius: var(--radius);
-      padding: 2rem;
-      margin: 1rem 0;
-      box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }
-
-    .attendees-section {
-      background: var(--cro-blue-100);
-      border: 1px solid var(--cro-blue-200);
-      border-radius: 12px;
-      padding: 1.5rem;
-      margin: 1rem 0;
-    }
-
-    .attendee-item {
-      background: var(--cro-white);
-      border: 1px solid var(--cro-plat-300);
-      border-radius: 8px;
-      padding: 1rem;
-      margin: 0.5rem 0;
-      display: flex;
-      flex-direction: column;
-      gap: 1rem;
-    }
-
-    .attendee-header {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-    }
-
-    .attendee-fields {
-      display: grid;
-      grid-template-columns: 2fr 2fr 2fr 1fr;
-      gap: 1rem;
-      flex: 1;
-    }
-
-    .attendee-status {
-      font-size: 0.8rem;
-      padding: 0.25rem 0.5rem;
-      border-radius: 4px;
-      margin-left: 1rem;
-    }
-
-    .status-unknown {
-      background: var(--cro-yellow-100);
-      color: var(--cro-yellow-700);
-    }
-
-    .status-found {
-      background: var(--cro-green-100);
-      color: var(--cro-green-700);
-    }
-
-    .status-new {
-      background: var(--cro-blue-100);
-      color: var(--cro-blue-700);
-    }
-
-    .status-researched {
-      background: var(--cro-purple-400);
-      color: var(--cro-white);
-    }
-
-    .attendee-actions {
-      display: flex;
-      gap: 0.5rem;
-      align-items: center;
-    }
-
-    .hubspot-btn {
-      background: var(--cro-green-600);
-      color: var(--cro-white);
-      font-size: 0.8rem;
-      padding: 0.4rem 0.8rem;
-    }
-
-    .hubspot-btn:hover {
-      background: var(--cro-green-700);
-    }
-
-    .research-phase {
-      background: var(--cro-yellow-100);
-      border: 1px solid var(--cro-yellow-400);
-      border-radius: 12px;
-      padding: 1.5rem;
-      margin: 1rem 0;
-    }
-
-    .phase-complete {
-      background: var(--cro-green-100);
-      border-color: var(--cro-green-400);
-    }
-
-    .linkedin-snippet {
-      background: var(--cro-blue-100);
-      border: 1px solid var(--cro-blue-200);
-      border-radius: 8px;
-      padding: 1rem;
-      margin-top: 0.5rem;
-      font-size: 0.9rem;
-      line-height: 1.4;
-    }
-
-    .linkedin-link {
-      color: var(--cro-blue-700);
-      text-decoration: none;
-      font-weight: 600;
-      display: inline-flex;
-      align-items: center;
-      gap: 0.5rem;
-      margin-top: 0.5rem;
-    }
-
-    .linkedin-link:hover {
-      color: var(--cro-blue-800);
-      text-decoration: underline;
-    }
-
-    .hubspot-status {
-      display: flex;
-      align-items: center;
-      gap: 0.5rem;
-      font-size: 0.9rem;
-      margin-top: 0.5rem;
-    }
-
-    .hubspot-status.found {
-      color: var(--cro-green-700);
-    }
-
-    .hubspot-status.not-found {
-      color: var(--cro-purple-700);
-    }
-
-    .research-results {
-      display: none;
-      margin-top: 1rem;
-      padding-top: 1rem;
-      border-top: 1px solid var(--cro-plat-300);
-    }
-
-    .research-results.show {
-      display: block;
-    }
-
-
-
-    #out{
-      background: var(--cro-white);
-      border: 1px solid var(--cro-plat-300);
-      padding: 2rem;
-      border-radius: var(--radius);
-      line-height: 1.6;
-      font-family: 'Montserrat', sans-serif;
-      box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-      margin-top: 2rem;
-    }
-
-    #out h1, #out h2, #out h3{
-      font-family: 'Montserrat', sans-serif;
-      margin-top: 2rem;
-      margin-bottom: 1rem;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out h1{
-      font-size: 2rem;
-      font-weight: 800;
-      border-bottom: 2px solid var(--cro-plat-300);
-      padding-bottom: 0.75rem;
-      color: var(--cro-blue-700);
-    }
-
-    #out h2{
-      font-size: 1.5rem;
-      font-weight: 700;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out h3{
-      font-size: 1.25rem;
-      font-weight: 600;
-      color: var(--cro-purple-700);
-    }
-
-    #out p{
-      margin: 1rem 0;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out ul, #out ol{
-      margin: 1rem 0;
-      padding-left: 2rem;
-    }
-
-    #out li{
-      margin: 0.5rem 0;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out strong{
-      font-weight: 700;
-      color: var(--cro-soft-black-700);
-    }
-
-    #out code{
-      background: var(--cro-plat-100);
-      padding: 0.25rem 0.5rem;
-      border-radius: 6px;
-      font-family: 'Monaco', 'Menlo', monospace;
-      font-size: 0.9rem;
-      color: var(--cro-soft-black-700);
-    }
-
-    .muted{
-      color: var(--cro-purple-400);
-      font-size: 0.875rem;
-      font-family: 'Montserrat', sans-serif;
-    }
-
-    .research-progress {
-      background: var(--cro-blue-100);
-      border: 1px solid var(--cro-blue-200);
-      border-radius: 12px;
-      padding: 1rem;
-      margin: 1rem 0;
-      font-family: 'Montserrat', sans-serif;
-    }
-
-    .research-step {
-      margin: 0.5rem 0;
-      color: var(--cro-blue-800);
-    }
-
-    /* Responsive Design */
-    @media (max-width: 768px) {
-      body { 
-        padding: 1rem; 
-      }
-      
-      .row { 
-        flex-direction: column; 
-        gap: 1rem; 
-      }
-      
-      .row > div { 
-        min-width: auto; 
-      }
-      
-      .attendee-fields {
-        grid-template-columns: 1fr;
-      }
-      
-      h1 { 
-        font-size: 2rem; 
-      }
-      
-      .card {
-        padding: 1.5rem;
-      }
-    }
-  </style>
-</head>
-<body>
-  <div class="nav-header">
-    <h1>BD Meeting Intelligence</h1>
-    <div class="nav-links">
-      <a href="/">Internal Meetings</a>
-      <a href="/bd" class="active">BD Meetings</a>
-    </div>
-  </div>
-
-  <div class="card">
-    <div class="row">
-      <div>
-        <label for="company">Target Company</label>
-        <input id="company" type="text" placeholder="Chobani" />
-      </div>
-      <div>
-        <label for="industry">Industry (optional)</label>
-        <input id="industry" type="text" placeholder="CPG, Food & Beverage" />
-      </div>
-      <div>
-        <label for="effort">Research Depth</label>
-        <select id="effort">
-          <option value="high" selected>Comprehensive</option>
-          <option value="medium">Standard</option>
-          <option value="low">Quick</option>
-        </select>
-      </div>
-    </div>
-
-    <div class="attendees-section">
-      <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-        <label style="margin: 0; font-size: 1.1rem;">Meeting Attendees</label>
-        <button type="button" class="secondary" onclick="addAttendee()">+ Add Attendee</button>
-      </div>
-      <div class="muted" style="margin-bottom: 1rem;">Add all meeting attendees for comprehensive research and LinkedIn discovery.</div>
-      
-      <div id="attendees-list">
-        <!-- Attendees will be added here dynamically -->
-      </div>
-      
-    </div>
-
-    <div class="research-phase" id="research-phase">
-      <h3 style="margin-top: 0; color: var(--cro-yellow-700);">Phase 1: Research Attendees</h3>
-      <p class="muted">First, let's research each attendee to gather their LinkedIn profiles and professional background.</p>
-      <div class="row">
-        <button id="research-attendees">Research All Attendees</button>
-        <div id="research-status" class="muted" style="align-self: center; margin-left: 1rem;"></div>
-      </div>
-    </div>
-
-    <label for="meeting_context">Meeting Context & Objectives</label>
-    <textarea id="meeting_context" placeholder="External BD meeting to explore partnership opportunities. Focus on digital transformation, data analytics, and consumer insights capabilities..."></textarea>
-
-    <label for="prompt">Research Instructions</label>
-    <textarea id="prompt">Create a strategic business development intelligence report using the research provided below.
-Focus on identifying specific opportunities where Cro Metrics can drive measurable business impact through our comprehensive digital growth services.
-
-CRITICAL: Map the target company's specific needs to Cro Metrics' current service offerings: Analytics, CRO, Creative Services, Customer Journey Analysis, Design & Build, Iris platform, Lifecycle & Email, Performance Marketing.
-
-Position Cro Metrics as "Your Agency for All Things Digital Growth" with $1B client impact, 97.4% retention rate, and 10X average ROI. Reference relevant client success stories (Home Chef, Curology, Bombas, Calendly, UNICEF USA) and industry expertise when applicable.
-
-Base all analysis on the research context provided. Mark gaps as **Unknown** and prioritize additional research needs.
-ALWAYS reference specific Cro Metrics services that align with their business challenges and demonstrate how our current offerings can solve their specific problems.</textarea>
-
-    <div class="research-phase phase-complete" id="intelligence-phase" style="display: none;">
-      <h3 style="margin-top: 0; color: var(--cro-green-700);">Phase 2: Generate Intelligence Report</h3>
-      <p class="muted">Now that we have researched all attendees, generate the comprehensive meeting intelligence report.</p>
-      <div class="row">
-        <button id="run">Generate Intelligence Report</button>
-        <div id="status" class="muted" style="align-self: center; margin-left: 1rem;"></div>
-      </div>
-    </div>
-  </div>
-
-  <div id="research-progress" class="research-progress" style="display: none;">
-    <h3>Research Progress</h3>
-    <div id="progress-steps"></div>
-  </div>
-
-  <h3 style="margin-top: 2rem; margin-bottom: 1rem; font-family: 'Montserrat', sans-serif; color: var(--cro-soft-black-700);">Intelligence Report</h3>
-  <div id="out">(report will appear here)</div>
-
-  <script>
-    const out = document.getElementById('out');
-    const statusEl = document.getElementById('status');
-    const progressEl = document.getElementById('research-progress');
-    const progressSteps = document.getElementById('progress-steps');
-    let attendeeCounter = 0;
-
-    function addAttendee(name = '', title = '', email = '') {
-      attendeeCounter++;
-      const attendeesList = document.getElementById('attendees-list');
-      
-      const attendeeDiv = document.createElement('div');
-      attendeeDiv.className = 'attendee-item';
-      attendeeDiv.id = `attendee-${attendeeCounter}`;
-      
-      attendeeDiv.innerHTML = `
-        <div class="attendee-header">
-          <div class="attendee-fields">
-            <input type="text" placeholder="Full Name" value="${name}" data-field="name">
-            <input type="text" placeholder="Title/Role" value="${title}" data-field="title">
-            <input type="text" placeholder="Company" value="" data-field="company">
-            <input type="email" placeholder="Email (optional)" value="${email}" data-field="email">
-          </div>
-          <div style="display: flex; align-items: center; gap: 1rem;">
-            <div class="attendee-status status-unknown" id="status-${attendeeCounter}">Unknown</div>
-            <div class="attendee-actions" id="actions-${attendeeCounter}" style="display: none;">
-              <button type="button" class="secondary hubspot-btn" onclick="addToHubSpot(${attendeeCounter})" style="display: none;">Add to HubSpot</button>
-            </div>
-            <button type="button" class="remove" onclick="removeAttendee(${attendeeCounter})">Remove</button>
-          </div>
-        </div>
-        <div class="research-results" id="research-${attendeeCounter}">
-          <!-- Research results will be populated here -->
-        </div>
-      `;
-      
-      attendeesList.appendChild(attendeeDiv);
-      
-      if (attendeesList.children.length === 1) {
-        // First attendee, don't allow removal
-        attendeeDiv.querySelector('.remove').style.display = 'none';
-      }
-    }
-
-    function removeAttendee(id) {
-      const attendeeDiv = document.getElementById(`attendee-${id}`);
-      if (attendeeDiv) {
-        attendeeDiv.remove();
-      }
-      
-      // If only one attendee left, hide its remove button
-      const attendeesList = document.getElementById('attendees-list');
-      if (attendeesList.children.length === 1) {
-        attendeesList.querySelector('.remove').style.display = 'none';
-      }
-    }
-
-    function getAttendees() {
-      const attendees = [];
-      const attendeeItems = document.querySelectorAll('.attendee-item');
-      
-      attendeeItems.forEach(item => {
-        const name = item.querySelector('[data-field="name"]').value.trim();
-        const title = item.querySelector('[data-field="title"]').value.trim();
-        const company = item.querySelector('[data-field="company"]').value.trim();
-        const email = item.querySelector('[data-field="email"]').value.trim();
-        
-        if (name) {
-          attendees.push({
-            name: name,
-            title: title,
-            company: company,
-            email: email
-          });
-        }
-      });
-      
-      return attendees;
-    }
-
-    let attendeeResearchData = [];
-
-    function addToHubSpot(attendeeId) {
-      const attendee = attendeeResearchData.find(a => a.ui_id === attendeeId);
-      if (!attendee) return;
-
-      const statusEl = document.getElementById(`status-${attendeeId}`);
-      const hubspotBtn = document.querySelector(`#actions-${attendeeId} .hubspot-btn`);
-      
-      statusEl.textContent = 'Adding to HubSpot...';
-      hubspotBtn.disabled = true;
-
-      // Call API to add to HubSpot
-      fetch('/api/bd/add-to-hubspot', {
-        method: 'POST',
-        headers: {'Content-Type': 'application/json'},
-        body: JSON.stringify({
-          attendee: {
-            name: attendee.name,
-            title: attendee.title,
-            company: attendee.company,
-            email: attendee.email,
-            linkedin_url: attendee.linkedin_url
-          }
-        })
-      })
-      .then(response => response.json())
-      .then(data => {
-        if (data.success) {
-          statusEl.textContent = 'Added to HubSpot';
-          statusEl.className = 'attendee-status status-found';
-          hubspotBtn.style.display = 'none';
-          attendee.hubspot_contact = {id: data.contact_id, created: true};
-        } else {
-          statusEl.textContent = 'HubSpot Error';
-          hubspotBtn.disabled = false;
-        }
-      })
-      .catch(error => {
-        statusEl.textContent = 'HubSpot Error';
-        hubspotBtn.disabled = false;
-      });
-    }
-
-    async function researchAttendees() {
-      const attendees = getAttendees();
-      if (attendees.length === 0) {
-        alert('Please add at least one attendee');
-        return;
-      }
-
-      const targetCompany = document.getElementById('company').value.trim();
-      if (!targetCompany) {
-        alert('Please enter the target company name');
-        return;
-      }
-
-      document.getElementById('research-attendees').disabled = true;
-      document.getElementById('research-status').textContent = 'Researching attendees...';
-      
-      attendeeResearchData = [];
-
-      try {
-        const response = await fetch('/api/bd/research-attendees', {
-          method: 'POST',
-          headers: {'Content-Type': 'application/json'},
-          body: JSON.stringify({
-            attendees: attendees,
-            target_company: targetCompany,
-            check_hubspot: true
-          })
-        });
-
-        const data = await response.json();
-        
-        if (response.ok) {
-          attendeeResearchData = data.researched_attendees;
-          
-          // Update UI with research results
-          attendeeResearchData.forEach((attendee, index) => {
-            const attendeeId = index + 1; // Assuming sequential IDs
-            attendee.ui_id = attendeeId;
-            
-            const statusEl = document.getElementById(`status-${attendeeId}`);
-            const actionsEl = document.getElementById(`actions-${attendeeId}`);
-            const hubspotBtn = actionsEl.querySelector('.hubspot-btn');
-            const researchResultsEl = document.getElementById(`research-${attendeeId}`);
-            
-            // Auto-populate fields with discovered information
-            const nameField = document.querySelector(`#attendee-${attendeeId} [data-field="name"]`);
-            const titleField = document.querySelector(`#attendee-${attendeeId} [data-field="title"]`);
-            const companyField = document.querySelector(`#attendee-${attendeeId} [data-field="company"]`);
-            const emailField = document.querySelector(`#attendee-${attendeeId} [data-field="email"]`);
-            
-            // Update fields if we have better information
-            if (attendee.company && !companyField.value) {
-              companyField.value = attendee.company;
-            }
-            
-            // Update status
-            if (attendee.linkedin_url) {
-              statusEl.textContent = `✓ LinkedIn Found`;
-              statusEl.className = 'attendee-status status-researched';
-            } else {
-              statusEl.textContent = 'No LinkedIn Found';
-              statusEl.className = 'attendee-status status-unknown';
-            }
-
-            // Build research results HTML
-            let researchHtml = '';
-            
-            // HubSpot Status
-            if (attendee.hubspot_contact) {
-              researchHtml += `
-                <div class="hubspot-status found">
-                  ✅ <strong>Found in HubSpot</strong> (Contact ID: ${attendee.hubspot_contact.id || 'N/A'})
-                </div>
-              `;
-              statusEl.textContent += ', In HubSpot';
-              statusEl.className = 'attendee-status status-found';
-            } else {
-              researchHtml += `
-                <div class="hubspot-status not-found">
-                  ℹ️ <strong>Not in HubSpot</strong> - Add button will appear below
-                </div>
-              `;
-              // Show HubSpot button if not in HubSpot (email not required)
-              hubspotBtn.style.display = 'inline-block';
-              actionsEl.style.display = 'flex';
-            }
-            
-            // LinkedIn Information
-            if (attendee.linkedin_url) {
-              researchHtml += `
-                <a href="${attendee.linkedin_url}" target="_blank" class="linkedin-link">
-                  🔗 View LinkedIn Profile
-                </a>
-              `;
-              
-              if (attendee.linkedin_snippet) {
-                researchHtml += `
-                  <div class="linkedin-snippet">
-                    <strong>${attendee.linkedin_title || 'LinkedIn Profile'}</strong><br>
-                    ${attendee.linkedin_snippet}
-                  </div>
-                `;
-              }
-            } else {
-              researchHtml += `
-                <div class="linkedin-snippet" style="background: var(--cro-yellow-100); border-color: var(--cro-yellow-400);">
-                  ⚠️ LinkedIn profile not found. You may want to search manually or verify the name/company.
-                </div>
-              `;
-            }
-            
-            researchResultsEl.innerHTML = researchHtml;
-            researchResultsEl.classList.add('show');
-          });
-
-          document.getElementById('research-status').textContent = `Research complete! Found ${data.linkedin_found} LinkedIn profiles.`;
-          
-          // Show Phase 2
-          document.getElementById('research-phase').style.display = 'none';
-          document.getElementById('intelligence-phase').style.display = 'block';
-          
-        } else {
-          throw new Error(data.detail || 'Research failed');
-        }
-        
-      } catch (error) {
-        document.getElementById('research-status').textContent = 'Research failed: ' + error.message;
-      } finally {
-        document.getElementById('research-attendees').disabled = false;
-      }
-    }
-
-    function parseMarkdown(text) {
-      // Simple markdown parser
-      let lines = text.split('\\n');
-      let html = [];
-      let inList = false;
-      
-      for (let line of lines) {
-        if (line.startsWith('### ')) {
-          html.push('<h3>' + line.substring(4) + '</h3>');
-        } else if (line.startsWith('## ')) {
-          html.push('<h2>' + line.substring(3) + '</h2>');
-        } else if (line.startsWith('# ')) {
-          html.push('<h1>' + line.substring(2) + '</h1>');
-        } else if (line.startsWith('- ') || line.startsWith('* ')) {
-          if (!inList) {
-            html.push('<ul>');
-            inList = true;
-          }
-          html.push('<li>' + line.substring(2) + '</li>');
-        } else if (line.match(/^\\d+\\. /)) {
-          if (!inList) {
-            html.push('<ol>');
-            inList = true;
-          }
-          html.push('<li>' + line.replace(/^\\d+\\. /, '') + '</li>');
-        } else {
-          if (inList) {
-            html.push('</ul>');
-            inList = false;
-          }
-          if (line.trim()) {
-            line = line.replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>');
-            line = line.replace(/\\*(.*?)\\*/g, '<em>$1</em>');
-            line = line.replace(/`(.*?)`/g, '<code>$1</code>');
-            html.push('<p>' + line + '</p>');
-          }
-        }
-      }
-      if (inList) html.push('</ul>');
-      return html.join('');
-    }
-
-    function updateProgress(step) {
-      const stepEl = document.createElement('div');
-      stepEl.className = 'research-step';
-      stepEl.textContent = '✓ ' + step;
-      progressSteps.appendChild(stepEl);
-    }
-
-    async function run(){
-      out.textContent = '';
-      statusEl.textContent = 'Generating intelligence report...';
-      progressEl.style.display = 'block';
-      progressSteps.innerHTML = '';
-      document.getElementById('run').disabled = true;
-      
-      try{
-        if (attendeeResearchData.length === 0) {
-          throw new Error('Please research attendees first');
-        }
-
-        const body = {
-          company_name: document.getElementById('company').value,
-          industry: document.getElementById('industry').value,
-          meeting_context: document.getElementById('meeting_context').value,
-          effort: document.getElementById('effort').value,
-          prompt: document.getElementById('prompt').value,
-          researched_attendees: attendeeResearchData
-        };
-        
-        updateProgress('Generating intelligence report with researched attendee data...');
-        
-        const r = await fetch('/api/bd/generate', {
-          method:'POST', 
-          headers:{'Content-Type':'application/json'}, 
-          body: JSON.stringify(body)
-        });
-        
-        const data = await r.json();
-        if(!r.ok){ throw new Error(data.detail || JSON.stringify(data)); }
-        
-        updateProgress('Intelligence report generated successfully!');
-        statusEl.textContent = 'Done.';
-        
-        const markdown = data.report_markdown || '(no output)';
-        out.innerHTML = parseMarkdown(markdown);
-        
-        setTimeout(() => {
-          progressEl.style.display = 'none';
-        }, 3000);
-        
-      }catch(e){
-        statusEl.textContent = 'Error: ' + (e && e.message ? e.message : e);
-        progressEl.style.display = 'none';
-      }finally{
-        document.getElementById('run').disabled = false;
-      }
-    }
-
-    // Initialize with one attendee
-    addAttendee();
-    
-    document.getElementById('research-attendees').addEventListener('click', researchAttendees);
-    document.getElementById('run').addEventListener('click', run);
-  </script>
-</body>
-</html>
-"""
-
-###############################################
-# Routes
-###############################################
-
-@app.get("/", response_class=HTMLResponse)
-async def index() -> str:
-    return INDEX_HTML
-
-@app.get("/api/channels")
-async def api_channels() -> JSONResponse:
-    channels = await list_channels(limit=400)
-    # Filter for channels starting with "bd-" or "internal-" and exclude archived
-    filtered_channels = [
-        c for c in channels 
-        if not c.get("is_archived", False) and 
-        c.get("name", "").startswith(("bd-", "internal-"))
-    ]
-    # Trim the payload for UI
-    result = [
-        {"id": c.get("id"), "name": c.get("name"), "is_private": bool(c.get("is_private"))}
-        for c in filtered_channels
-    ]
-    return JSONResponse({"channels": result})
+def _compose_bd_context(
+    company_name: str,
+    industry: str,
+    attendees: List[Dict[str, Any]],
+    research_context: str,
+    meeting_context: str,
+) -> str:
+    """Full BD context for the model. Slow-changing research comes first and the
+    user-edited meeting context last, so regenerations share the longest possible
+    prompt prefix (and hit OpenAI's prompt cache)."""
+    attendee_summary = ", ".join([f"{a['name']} ({a['title'] or 'Title TBD'})" for a in attendees])
+    return (
+        f"TARGET COMPANY: {company_name}\n"
+        f"INDUSTRY: {industry or 'Not specified'}\n"
+        f"MEETING ATTENDEES: {attendee_summary}\n\n"
+        f"RESEARCH INTELLIGENCE:\n{research_context}\n\n"
+        f"MEETING CONTEXT: {meeting_context or 'Not provided'}"
+    )
 
-@app.get("/bd", response_class=HTMLResponse)
-async def bd_index() -> str:
-    return BD_INDEX_HTML
+# research_company() keys in the order they appear in the report context
+_COMPANY_RESEARCH_SECTIONS = (
+    ("company_overview", "## Company Overview Research"),
+    ("recent_news", "## Recent News & Developments"),
+    ("financial_info", "## Financial & Performance Data"),
+    ("digital_transformation", "## Digital Transformation & Technology"),
+)
 
-@app.post("/api/bd/generate")
-async def api_bd_generate(req: Request) -> JSONResponse:
-    payload = await req.json()
+def _fmt_research_item(item: Dict[str, Any]) -> str:
+    """One search result as a title / source / snippet block."""
+    return (
+        f"**{item.get('title', 'N/A')}**\n"
+        f"Source: {item.get('link', 'N/A')}\n"
+        f"{_clip(item.get('snippet') or 'No snippet available')}\n"
+    )
 
-    company_name = (payload.get("company_name") or "").strip()
-    if not company_name:
-        raise HTTPException(status_code=400, detail="company_name is required")
+async def _research_bd_meeting(
+    payload: Dict[str, Any],
+    company_name: str,
+    researched_attendees: List[Dict[str, Any]],
+    attendees_data: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[str], str]:
+    """Company, competitive and (legacy) attendee research for a BD report.
+    Returns the enriched attendees, the research sections and the composed LLM context.
+    """
+    industry = (payload.get("industry") or "").strip()
+    meeting_context = (payload.get("meeting_context") or "").strip()
 
-    # Handle both old format and new researched attendees format
-    researched_attendees = payload.get("researched_attendees", [])
     if researched_attendees:
-        # New workflow: use pre-researched attendees
         enriched_attendees = researched_attendees
+        attendee_research = []
+        primary_name = researched_attendees[0].get("name", "")
     else:
-        # Legacy workflow: research attendees inline (backwards compatibility)
-        attendees_data = payload.get("attendees", [])
-        if not attendees_data:
-            # Fallback to old format for backwards compatibility
-            executive_name = (payload.get("executive_name") or "").strip()
-            executive_title = (payload.get("executive_title") or "").strip()
-            if executive_name:
-                attendees_data = [{"name": executive_name, "title": executive_title, "email": ""}]
-
-        if not attendees_data:
-            raise HTTPException(status_code=400, detail="At least one attendee is required")
-        
         # Legacy inline research (for backwards compatibility)
-        enriched_attendees = []
-        hubspot_contacts = []
+        contacts_by_email = None
         
         # Check HubSpot for existing contacts if requested
         check_hubspot = payload.get("check_hubspot", True)
-        if check_hubspot and HUBSPOT_TOKEN:
-            attendee_emails = [a.get("email") for a in attendees_data if a.get("email")]
-            if attendee_emails:
-                try:
-                    hubspot_contacts = await fetch_contacts_by_email(attendee_emails)
-                except Exception:
-                    hubspot_contacts = []
+        if check_hubspot:
+            contacts_by_email = await _prefetch_contacts_by_email(attendees_data)
         
-        for attendee in attendees_data:
-            name = attendee.get("name", "").strip()
-            title = attendee.get("title", "").strip()
-            email = attendee.get("email", "").strip()
-            
-            if not name:
-                continue
-                
-            enriched_attendee = {
-                "name": name,
-                "title": title,
-                "email": email,
-                "company": company_name,
-                "linkedin_url": None,
-                "linkedin_snippet": None,
-                "linkedin_title": None,
-                "hubspot_contact": None,
-                "background_research": None
-            }
-            
-            # Check if this attendee exists in HubSpot (enhanced search)
-            hubspot_contact = await find_hubspot_contact(name, email, company_name)
-            if hubspot_contact:
-                enriched_attendee["hubspot_contact"] = hubspot_contact
-                enriched_attendee["linkedin_url"] = hubspot_contact.get("linkedin_url")
-            
-            # LinkedIn discovery if not already found in HubSpot
-            if not enriched_attendee["linkedin_url"]:
-                linkedin_data = await research_attendee_linkedin(name, company_name, title)
-                enriched_attendee["linkedin_url"] = linkedin_data.get("url")
-                enriched_attendee["linkedin_snippet"] = linkedin_data.get("snippet")
-                enriched_attendee["linkedin_title"] = linkedin_data.get("title")
-            
-            # Background research
-            background_data = await research_attendee_background(
-                name, company_name, title, enriched_attendee["linkedin_url"] or ""
+        # Attendee research joins the company research gather below
+        enriched_attendees = []
+        attendee_research = [
+            _enrich_attendee(
+                attendee.get("name", "").strip(),
+                attendee.get("title", "").strip(),
+                attendee.get("email", "").strip(),
+                company_name,
+                contacts_by_email,
             )
-            enriched_attendee["background_research"] = background_data
-            
-            enriched_attendees.append(enriched_attendee)
-
-    industry = (payload.get("industry") or "").strip()
-    meeting_context = (payload.get("meeting_context") or "").strip()
-    effort = (payload.get("effort") or "high").lower()
-    prompt = (payload.get("prompt") or BD_DEFAULT_PROMPT).strip()
+            for attendee in attendees_data
+            if attendee.get("name", "").strip()
+        ]
+        primary_name = next(
+            (a.get("name", "").strip() for a in attendees_data if a.get("name", "").strip()), ""
+        )
 
-    # 1) Company research
-    # Use the first attendee's name for company research
-    primary_attendee = enriched_attendees[0] if enriched_attendees else {"name": ""}
-    research_data = await research_company(company_name, primary_attendee.get("name", ""))
-    
-    # 2) Competitive landscape research
-    competitive_data = await research_competitive_landscape(company_name, industry)
+    # 1-2) Company, competitive landscape and (legacy) attendee research are independent,
+    # so they share one gather; the first attendee's name seeds the company research
+    research_data, competitive_data, *inline_attendees = await asyncio.gather(
+        research_company(company_name, primary_name),
+        research_competitive_landscape(company_name, industry),
+        *attendee_research,
+    )
+    if attendee_research:
+        enriched_attendees = inline_attendees
     
     # 3) Format research context
     research_sections = []
     
-    # Company overview
-    if research_data.get("company_overview"):
-        research_sections.append("## Company Overview Research")
-        for item in research_data["company_overview"]:
-            research_sections.append(f"**{item.get('title', 'N/A')}**")
-            research_sections.append(f"Source: {item.get('link', 'N/A')}")
-            research_sections.append(f"{item.get('snippet', 'No snippet available')}\n")
-    
-    # Recent news
-    if research_data.get("recent_news"):
-        research_sections.append("## Recent News & Developments")
-        for item in research_data["recent_news"]:
-            research_sections.append(f"**{item.get('title', 'N/A')}**")
-            research_sections.append(f"Source: {item.get('link', 'N/A')}")
-            research_sections.append(f"{item.get('snippet', 'No snippet available')}\n")
-    
-    # Financial information
-    if research_data.get("financial_info"):
-        research_sections.append("## Financial & Performance Data")
-        for item in research_data["financial_info"]:
-            research_sections.append(f"**{item.get('title', 'N/A')}**")
-            research_sections.append(f"Source: {item.get('link', 'N/A')}")
-            research_sections.append(f"{item.get('snippet', 'No snippet available')}\n")
-    
-    # Digital transformation focus
-    if research_data.get("digital_transformation"):
-        research_sections.append("## Digital Transformation & Technology")
-        for item in research_data["digital_transformation"]:
-            research_sections.append(f"**{item.get('title', 'N/A')}**")
-            research_sections.append(f"Source: {item.get('link', 'N/A')}")
-            research_sections.append(f"{item.get('snippet', 'No snippet available')}\n")
+    for key, heading in _COMPANY_RESEARCH_SECTIONS:
+        items = research_data.get(key)
+        if items:
+            research_sections.append(heading)
+            research_sections.extend(_fmt_research_item(item) for item in items)
     
     # Attendee profiles
     if enriched_attendees:
         research_sections.append("## Meeting Attendee Profiles")
         for attendee in enriched_attendees:
             research_sections.append(f"### {attendee['name']}")
-            research_sections.append(f"**Title:** {attendee['title'] or 'Not specified'}")
+            research_sections.append(f"**Title:** {_clip(attendee['title'] or 'Not specified', TITLE_MAX_CHARS)}")
             research_sections.append(f"**Email:** {attendee['email'] or 'Not provided'}")
             if attendee['linkedin_url']:
                 research_sections.append(f"**LinkedIn:** {attendee['linkedin_url']}")
@@ -2833,63 +2121,159 @@ async def api_bd_generate(req: Request) -> JSONResponse:
                     research_sections.append("**Professional Background:**")
                     for item in bg_research['background_info'][:2]:  # Limit to top 2 results
                         research_sections.append(f"- {item.get('title', 'N/A')}")
-                        research_sections.append(f"  {item.get('snippet', 'No snippet available')}")
+                        research_sections.append(f"  {_clip(item.get('snippet') or 'No snippet available')}")
                 
                 if bg_research.get('career_highlights'):
                     research_sections.append("**Career Highlights:**")
                     for item in bg_research['career_highlights'][:1]:  # Limit to top result
-                        research_sections.append(f"- {item.get('snippet', 'No information available')}")
+                        research_sections.append(f"- {_clip(item.get('snippet') or 'No information available')}")
             
             research_sections.append("")  # Add spacing between attendees
     
     # Competitive landscape
     if competitive_data:
         research_sections.append("## Competitive Landscape Analysis")
-        for item in competitive_data:
-            research_sections.append(f"**{item.get('title', 'N/A')}**")
-            research_sections.append(f"Source: {item.get('link', 'N/A')}")
-            research_sections.append(f"{item.get('snippet', 'No snippet available')}\n")
+        research_sections.extend(_fmt_research_item(item) for item in competitive_data)
 
     research_context = "\n".join(research_sections) if research_sections else "No research data available."
     
     # 4) Compose full context
-    attendee_summary = ", ".join([f"{a['name']} ({a['title'] or 'Title TBD'})" for a in enriched_attendees])
-    composed_context = (
-        f"TARGET COMPANY: {company_name}\n"
-        f"MEETING ATTENDEES: {attendee_summary}\n"
-        f"INDUSTRY: {industry or 'Not specified'}\n"
-        f"MEETING CONTEXT: {meeting_context or 'Not provided'}\n\n"
-        f"RESEARCH INTELLIGENCE:\n{research_context}"
-    )
+    composed_context = _compose_bd_context(company_name, industry, enriched_attendees, research_context, meeting_context)
+
+    return enriched_attendees, research_sections, composed_context
+
+def _bd_report_meta(
+    company_name: str,
+    enriched_attendees: List[Dict[str, Any]],
+    research_sections: List[str],
+    effort: str,
+) -> Dict[str, Any]:
+    """Summary counts returned alongside a BD report."""
+    return {
+        "company_name": company_name,
+        "attendees_researched": len(enriched_attendees),
+        "linkedin_urls_found": sum(1 for a in enriched_attendees if a["linkedin_url"]),
+        "hubspot_contacts_found": sum(1 for a in enriched_attendees if a["hubspot_contact"] and not a["hubspot_contact"].get("created")),
+        "hubspot_contacts_created": sum(1 for a in enriched_attendees if a["hubspot_contact"] and a["hubspot_contact"].get("created")),
+        "research_sections": len(research_sections),
+        "effort": effort,
+    }
+
+# escape=True turns any raw HTML in the model output (or quoted search snippets) into text
+_report_markdown = (
+    mistune.create_markdown(escape=True, plugins=["strikethrough", "table"]) if mistune is not None else None
+)
+
+def _report_html(markdown_text: str) -> Optional[str]:
+    """Sanitized HTML for a finished report, or None when mistune isn't installed."""
+    if _report_markdown is None:
+        return None
+    return _report_markdown(markdown_text)
+
+def _bd_report_cache_key(prompt: str, composed_context: str, effort: str) -> str:
+    """Identifies a BD report by everything that goes into generating it."""
+    return _cache_key(OPENAI_MODEL, effort, str(STRUCTURED_OUTPUT), str(SELF_CRITIQUE), prompt, composed_context)
 
-    # Log intelligence report generation
+def _log_bd_report(req: Request, payload: Dict[str, Any], company_name: str, attendee_count: int,
+                   effort: str, prompt: str, composed_context: str) -> None:
+    """Log intelligence report generation."""
     log_usage("intelligence_report", {
         "company_name": company_name,
-        "industry": industry,
-        "attendee_count": len(enriched_attendees),
+        "industry": (payload.get("industry") or "").strip(),
+        "attendee_count": attendee_count,
         "effort": effort,
         "prompt_length": len(prompt),
         "context_length": len(composed_context)
     }, req)
 
-    # 5) Generate BD intelligence report
+async def _bd_report_events(
+    req: Request,
+    payload: Dict[str, Any],
+    company_name: str,
+    researched_attendees: List[Dict[str, Any]],
+    attendees_data: List[Dict[str, Any]],
+    effort: str,
+    prompt: str,
+) -> AsyncIterator[str]:
+    """SSE stream for a BD report: status updates during research, then report deltas, then meta."""
     try:
-        report = await asyncio.wait_for(ask_o3_bd(prompt, composed_context, effort=effort), timeout=300.0)
+        yield _sse("status", {"message": "Researching company, competitive landscape and attendees..."})
+        enriched_attendees, research_sections, composed_context = await _research_bd_meeting(
+            payload, company_name, researched_attendees, attendees_data
+        )
+        _log_bd_report(req, payload, company_name, len(enriched_attendees), effort, prompt, composed_context)
+
+        cache_key = _bd_report_cache_key(prompt, composed_context, effort)
+        report = None if payload.get("refresh") else _bd_report_cache.get(cache_key)
+        if report is not None:
+            yield _sse("status", {"message": "Research unchanged, reusing the report generated for these inputs..."})
+            yield _sse("delta", {"text": report})
+        else:
+            yield _sse("status", {"message": "Research complete, writing the intelligence report..."})
+            parts = []
+            async for delta in _with_deadline(ask_o3_bd_stream(prompt, composed_context, effort=effort), 300.0):
+                parts.append(delta)
+                yield _sse("delta", {"text": delta})
+            report = "".join(parts)
+            if report:
+                _bd_report_cache.set(cache_key, report)
+            else:
+                report = NO_TEXT_OUTPUT
+                yield _sse("delta", {"text": report})
+        yield _sse("done", {
+            "meta": _bd_report_meta(company_name, enriched_attendees, research_sections, effort),
+            "report_html": _report_html(report),
+        })
+    except asyncio.TimeoutError:
+        yield _sse("error", {"detail": "OpenAI API error: report generation timed out"})
     except Exception as e:
-        # Return the actual error for debugging
-        raise HTTPException(status_code=500, detail=f"OpenAI API error: {str(e)}")
+        print(f"Streaming BD report failed: {e}")
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        yield _sse("error", {"detail": f"Report generation failed: {detail}"})
+
+@app.post("/api/bd/generate")
+async def api_bd_generate(req: Request) -> Response:
+    payload = await req.json()
+
+    company_name = (payload.get("company_name") or "").strip()
+    if not company_name:
+        raise HTTPException(status_code=400, detail="company_name is required")
+
+    researched_attendees, attendees_data = _bd_attendee_inputs(payload)
+    effort = (payload.get("effort") or "high").lower()
+    prompt = (payload.get("prompt") or BD_DEFAULT_PROMPT).strip()
+
+    if "text/event-stream" in req.headers.get("accept", ""):
+        # Clients that accept SSE get research progress and the report as it is written
+        return StreamingResponse(
+            _bd_report_events(req, payload, company_name, researched_attendees, attendees_data, effort, prompt),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
-    return JSONResponse({
+    enriched_attendees, research_sections, composed_context = await _research_bd_meeting(
+        payload, company_name, researched_attendees, attendees_data
+    )
+    _log_bd_report(req, payload, company_name, len(enriched_attendees), effort, prompt, composed_context)
+
+    # 5) Generate BD intelligence report (re-runs on identical inputs reuse the last one)
+    cache_key = _bd_report_cache_key(prompt, composed_context, effort)
+    report = None if payload.get("refresh") else _bd_report_cache.get(cache_key)
+    if report is None:
+        try:
+            report = await asyncio.wait_for(ask_o3_bd(prompt, composed_context, effort=effort), timeout=300.0)
+        except Exception as e:
+            # Return the actual error for debugging
+            raise HTTPException(status_code=500, detail=f"OpenAI API error: {str(e)}")
+        if report:
+            _bd_report_cache.set(cache_key, report)
+        else:
+            report = NO_TEXT_OUTPUT
+
+    return ORJSONResponse({
         "report_markdown": report,
-        "meta": {
-            "company_name": company_name,
-            "attendees_researched": len(enriched_attendees),
-            "linkedin_urls_found": sum(1 for a in enriched_attendees if a["linkedin_url"]),
-            "hubspot_contacts_found": sum(1 for a in enriched_attendees if a["hubspot_contact"] and not a["hubspot_contact"].get("created")),
-            "hubspot_contacts_created": sum(1 for a in enriched_attendees if a["hubspot_contact"] and a["hubspot_contact"].get("created")),
-            "research_sections": len(research_sections),
-            "effort": effort,
-        }
+        "report_html": _report_html(report),
+        "meta": _bd_report_meta(company_name, enriched_attendees, research_sections, effort),
     })
 
 @app.post("/api/bd/research-attendees")
@@ -2913,61 +2297,26 @@ async def api_bd_research_attendees(req: Request) -> JSONResponse:
     }, req)
     
     # Research each attendee
-    enriched_attendees = []
-    hubspot_contacts = []
+    contacts_by_email = None
     
     # Check HubSpot for existing contacts if requested
-    if check_hubspot and HUBSPOT_TOKEN:
-        attendee_emails = [a.get("email") for a in attendees_data if a.get("email")]
-        if attendee_emails:
-            try:
-                hubspot_contacts = await fetch_contacts_by_email(attendee_emails)
-            except Exception:
-                hubspot_contacts = []
+    if check_hubspot:
+        contacts_by_email = await _prefetch_contacts_by_email(attendees_data)
     
-    for attendee in attendees_data:
-        name = attendee.get("name", "").strip()
-        title = attendee.get("title", "").strip()
-        company = attendee.get("company", "").strip() or target_company
-        email = attendee.get("email", "").strip()
-        
-        if not name:
-            continue
-            
-        enriched_attendee = {
-            "name": name,
-            "title": title,
-            "company": company,
-            "email": email,
-            "linkedin_url": None,
-            "linkedin_snippet": None,
-            "linkedin_title": None,
-            "hubspot_contact": None,
-            "background_research": None
-        }
-        
-        # Check if this attendee exists in HubSpot (enhanced search)
-        hubspot_contact = await find_hubspot_contact(name, email, company)
-        if hubspot_contact:
-            enriched_attendee["hubspot_contact"] = hubspot_contact
-            enriched_attendee["linkedin_url"] = hubspot_contact.get("linkedin_url")
-        
-        # LinkedIn discovery if not already found in HubSpot
-        if not enriched_attendee["linkedin_url"]:
-            linkedin_data = await research_attendee_linkedin(name, company, title)
-            enriched_attendee["linkedin_url"] = linkedin_data.get("url")
-            enriched_attendee["linkedin_snippet"] = linkedin_data.get("snippet")
-            enriched_attendee["linkedin_title"] = linkedin_data.get("title")
-        
-        # Background research
-        background_data = await research_attendee_background(
-            name, company, title, enriched_attendee["linkedin_url"] or ""
+    # Research all attendees concurrently; gather keeps the input order
+    enriched_attendees = list(await asyncio.gather(*[
+        _enrich_attendee(
+            attendee.get("name", "").strip(),
+            attendee.get("title", "").strip(),
+            attendee.get("email", "").strip(),
+            attendee.get("company", "").strip() or target_company,
+            contacts_by_email,
         )
-        enriched_attendee["background_research"] = background_data
-        
-        enriched_attendees.append(enriched_attendee)
+        for attendee in attendees_data
+        if attendee.get("name", "").strip()
+    ]))
     
-    return JSONResponse({
+    return ORJSONResponse({
         "researched_attendees": enriched_attendees,
         "linkedin_found": sum(1 for a in enriched_attendees if a["linkedin_url"]),
         "hubspot_found": sum(1 for a in enriched_attendees if a["hubspot_contact"]),
@@ -2995,30 +2344,70 @@ async def api_bd_add_to_hubspot(req: Request) -> JSONResponse:
     contact_id = await create_hubspot_contact(attendee_data)
     
     if contact_id:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "contact_id": contact_id,
             "message": "Contact created successfully"
         })
     else:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "message": "Failed to create HubSpot contact"
         }, status_code=400)
 
+@app.post("/api/bd/add-to-hubspot-batch")
+async def api_bd_add_to_hubspot_batch(req: Request) -> JSONResponse:
+    """Add several attendees to HubSpot with one batch create."""
+    payload = await req.json()
+    
+    attendees = payload.get("attendees") or []
+    if not attendees or not all((a.get("name") or "").strip() for a in attendees):
+        raise HTTPException(status_code=400, detail="Every attendee needs a name")
+    
+    log_usage("hubspot_contact_add_batch", {
+        "count": len(attendees),
+        "with_email": sum(1 for a in attendees if a.get("email")),
+        "with_linkedin": sum(1 for a in attendees if a.get("linkedin_url"))
+    }, req)
+    
+    contact_ids = await create_hubspot_contacts(attendees)
+    
+    return ORJSONResponse({
+        "success": any(contact_ids),
+        "results": [{"contact_id": cid, "success": bool(cid)} for cid in contact_ids]
+    })
+
+@app.post("/api/bd/cache-clear")
+async def api_bd_cache_clear(req: Request) -> JSONResponse:
+    """Drop cached web search results, HubSpot lookups and reports so the next run starts fresh."""
+    cleared = _search_cache.clear() + _contacts_cache.clear() + _bd_report_cache.clear()
+    log_usage("bd_cache_clear", {"cleared": cleared}, req)
+    return ORJSONResponse({"success": True, "cleared": cleared})
+
+def _tail_lines(path: str, count: int, block_size: int = 65536) -> List[str]:
+    """Return the last `count` lines of a file, reading backwards in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", "ignore").splitlines()
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut mid-entry
+    return lines[-count:]
+
 @app.get("/api/usage-logs")
 async def api_usage_logs(req: Request) -> JSONResponse:
     """View usage logs for analysis (last 100 entries)."""
     try:
         if not os.path.exists(usage_log_file):
-            return JSONResponse({"logs": [], "message": "No usage logs found"})
+            return ORJSONResponse({"logs": [], "message": "No usage logs found"})
         
-        # Read the last 100 lines of the log file
-        with open(usage_log_file, 'r') as f:
-            lines = f.readlines()
-        
-        # Get last 100 lines and parse as JSON
-        recent_lines = lines[-100:] if len(lines) > 100 else lines
+        # Read only the last 100 lines; the log grows without bound
+        recent_lines = _tail_lines(usage_log_file, 100)
         logs = []
         
         for line in recent_lines:
@@ -3031,14 +2420,14 @@ async def api_usage_logs(req: Request) -> JSONResponse:
             except (json.JSONDecodeError, ValueError):
                 continue
         
-        return JSONResponse({
+        return ORJSONResponse({
             "logs": logs,
             "total_entries": len(logs),
             "log_file_path": usage_log_file
         })
         
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "error": str(e),
             "message": "Failed to read usage logs"
         }, status_code=500)
@@ -3047,37 +2436,37 @@ async def api_usage_logs(req: Request) -> JSONResponse:
 async def api_debug_hubspot_contact(contact_id: str) -> JSONResponse:
     """Debug endpoint to inspect a specific HubSpot contact."""
     if not HUBSPOT_TOKEN:
-        return JSONResponse({"error": "HubSpot token not configured"}, status_code=400)
+        return ORJSONResponse({"error": "HubSpot token not configured"}, status_code=400)
     
     try:
         headers = {"Authorization": f"Bearer {HUBSPOT_TOKEN}", "Content-Type": "application/json"}
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/{contact_id}", headers=headers)
+        client = _http_client()
+        resp = await client.get(f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/{contact_id}", headers=headers)
             
-            if resp.status_code == 200:
-                contact_data = resp.json()
-                properties = contact_data.get("properties", {})
+        if resp.status_code == 200:
+            contact_data = resp.json()
+            properties = contact_data.get("properties", {})
                 
-                return JSONResponse({
-                    "contact_id": contact_id,
-                    "properties": properties,
-                    "debug_info": {
-                        "firstname": properties.get("firstname"),
-                        "lastname": properties.get("lastname"), 
-                        "email": properties.get("email"),
-                        "company": properties.get("company"),
-                        "jobtitle": properties.get("jobtitle"),
-                        "linkedin_url": properties.get("linkedin_url")
-                    }
-                })
-            else:
-                return JSONResponse({
-                    "error": f"HubSpot API error: {resp.status_code}",
-                    "response": resp.text[:300]
-                }, status_code=400)
+            return ORJSONResponse({
+                "contact_id": contact_id,
+                "properties": properties,
+                "debug_info": {
+                    "firstname": properties.get("firstname"),
+                    "lastname": properties.get("lastname"), 
+                    "email": properties.get("email"),
+                    "company": properties.get("company"),
+                    "jobtitle": properties.get("jobtitle"),
+                    "linkedin_url": properties.get("linkedin_url")
+                }
+            })
+        else:
+            return ORJSONResponse({
+                "error": f"HubSpot API error: {resp.status_code}",
+                "response": resp.text[:300]
+            }, status_code=400)
                 
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "error": f"Debug failed: {str(e)}"
         }, status_code=500)
 
@@ -3121,7 +2510,7 @@ async def api_debug_responses_test() -> JSONResponse:
                             parts.append(c["text"])
             output_text = "".join(parts)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "success",
             "api_working": True,
             "response": output_text,
@@ -3129,14 +2518,14 @@ async def api_debug_responses_test() -> JSONResponse:
             "method": "responses.create"
         })
     except AttributeError as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "error",
             "api_working": False,
             "error": f"Responses API not available: {str(e)}",
             "suggestion": "SDK may not support responses API"
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "error", 
             "api_working": False,
             "error": f"API call failed: {str(e)}",
@@ -3213,23 +2602,16 @@ async def api_debug_prompt_preview(req: Request) -> JSONResponse:
         research_context = "\n".join(research_sections)
         
         # Compose the full context exactly as sent to OpenAI
-        attendee_summary = ", ".join([f"{a['name']} ({a['title'] or 'Title TBD'})" for a in researched_attendees])
-        composed_context = (
-            f"TARGET COMPANY: {company_name}\n"
-            f"MEETING ATTENDEES: {attendee_summary}\n"
-            f"INDUSTRY: {industry or 'Not specified'}\n"
-            f"MEETING CONTEXT: {meeting_context or 'Not provided'}\n\n"
-            f"RESEARCH INTELLIGENCE:\n{research_context}"
-        )
+        composed_context = _compose_bd_context(company_name, industry, researched_attendees, research_context, meeting_context)
         
         # Return the exact prompt structure sent to OpenAI
-        return JSONResponse({
+        return ORJSONResponse({
             "system_message": BD_DEV_MESSAGE,
             "user_prompt": prompt,
             "research_context": composed_context,
             "full_prompt_preview": {
                 "role_developer": BD_DEV_MESSAGE,
-                "role_user": prompt + "\n\n" + composed_context
+                "role_user": [composed_context, prompt]
             },
             "prompt_stats": {
                 "system_message_length": len(BD_DEV_MESSAGE),
@@ -3240,12 +2622,26 @@ async def api_debug_prompt_preview(req: Request) -> JSONResponse:
         })
         
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "error": f"Prompt preview failed: {str(e)}"
         }, status_code=500)
 
+# Brief row templates, bound once rather than re-parsed per contact
+_ATTENDEE_ROW = "{}- {} {} — {} ({}){}".format
+_ACCOUNT_ROW = "{}• {} — lifecycle: {}  (contact: {})".format
+
+@dataclasses.dataclass(slots=True)
+class BriefMeta:
+    """The meta block returned alongside a brief."""
+    channel_id: str
+    lookback_days: int
+    messages_limit: int
+    attendees_found: int
+    effort: str
+    model: str
+
 @app.post("/api/run")
-async def api_run(req: Request) -> JSONResponse:
+async def api_run(req: Request) -> Response:
     payload = await req.json()
 
     channel_id = (payload.get("channel_id") or "").strip()
@@ -3259,61 +2655,146 @@ async def api_run(req: Request) -> JSONResponse:
     prompt = (payload.get("prompt") or DEFAULT_USER_PROMPT).strip()
 
     attendees_raw = payload.get("attendee_emails") or ""
-    attendee_emails = [e.strip() for e in attendees_raw.split(",") if e.strip()]
+    attendee_emails = _hubspot_lookup_emails(attendees_raw.split(","))
     purpose = (payload.get("purpose") or "").strip()
 
-    # 1) Slack context
-    context_block, actual_days = await fetch_channel_context(
-        channel_id,
-        lookback_days=lookback_days,
-        max_messages=limit,
-        resolve_names=resolve_names,
-        expand_threads=True,
-    )
-
     # 2) HubSpot enrichment (optional)
-    contacts: List[Dict[str, Any]] = []
-    if attendee_emails and HUBSPOT_TOKEN:
+    async def hubspot_contacts() -> List[Dict[str, Any]]:
+        if not (attendee_emails and HUBSPOT_TOKEN):
+            return []
         try:
-            contacts = await asyncio.wait_for(fetch_contacts_by_email(attendee_emails), timeout=30.0)
+            return await asyncio.wait_for(fetch_contacts_by_email(attendee_emails), timeout=30.0)
         except asyncio.TimeoutError:
-            contacts = []
-
-    attendee_block = "\n".join(
-        f"- {c.get('firstname','').strip()} {c.get('lastname','').strip()} — {c.get('jobtitle','') or ''} (" \
-        f"{c.get('email')})" + (f" — {c.get('linkedin_url')}" if c.get('linkedin_url') else "")
-        for c in contacts
-    ) or "(none provided)"
-
-    account_block = "\n".join(
-        f"• {c.get('company') or '—'} — lifecycle: {c.get('lifecyclestage') or 'n/a'}  (contact: {c.get('email')})"
-        for c in contacts
-    ) or "(no HubSpot context)"
-
-    composed_context = (
-        f"MEETING PURPOSE:\n{(purpose or '(not provided)')}\n\n"
-        f"ATTENDEES:\n{attendee_block}\n\n"
-        f"ACCOUNT CONTEXT (HubSpot):\n{account_block}\n\n"
-        f"RECENT SLACK (last {actual_days} days):\n{context_block}"
+            return []
+
+    # 1-2) Slack context and HubSpot lookups are independent; fetch them side by side.
+    # return_exceptions lets both finish before a failure from either is raised.
+    slack_result, contacts_result = await asyncio.gather(
+        fetch_channel_context(
+            channel_id,
+            lookback_days=lookback_days,
+            max_messages=limit,
+            resolve_names=resolve_names,
+            expand_threads=True,
+        ),
+        hubspot_contacts(),
+        return_exceptions=True,
     )
+    if isinstance(slack_result, BaseException):
+        raise slack_result
+    if isinstance(contacts_result, BaseException):
+        raise contacts_result
+    context_block, actual_days = slack_result
+    contacts: List[Dict[str, Any]] = contacts_result
+
+    if not contacts:
+        # Nothing found (or nothing looked up): skip the buffers entirely
+        attendee_block = "(none provided)"
+        account_block = "(no HubSpot context)"
+    else:
+        # One pass over contacts builds both the attendee and account lines; sorted so the same
+        # attendees always produce the same text whatever order HubSpot returned them in
+        # Rows are written straight into two buffers rather than kept as per-row strings
+        attendee_buf = io.StringIO()
+        account_buf = io.StringIO()
+        sep = ""
+        for c in sorted(contacts, key=lambda c: (c.get("email") or "").lower()):
+            # Each property is read once and shared by both rows
+            g = c.get
+            firstname = (g('firstname') or '').strip()
+            lastname = (g('lastname') or '').strip()
+            email = g('email')
+            jobtitle = _clip(g('jobtitle') or '', TITLE_MAX_CHARS)
+            linkedin_url = g('linkedin_url')
+            linkedin_suffix = f" — {linkedin_url}" if linkedin_url else ""
+            company = g('company') or '—'
+            lifecycle = g('lifecyclestage') or 'n/a'
+            attendee_buf.write(_ATTENDEE_ROW(sep, firstname, lastname, jobtitle, email, linkedin_suffix))
+            account_buf.write(_ACCOUNT_ROW(sep, company, lifecycle, email))
+            sep = "\n"
+        attendee_block = attendee_buf.getvalue()
+        account_block = account_buf.getvalue()
+
+    # Largest, slowest-changing block first; the free-text purpose last
+    context_parts = [
+        f"RECENT SLACK (last {actual_days} days):\n{context_block}",
+        f"ACCOUNT CONTEXT (HubSpot):\n{account_block}",
+        f"ATTENDEES:\n{attendee_block}",
+        f"MEETING PURPOSE:\n{purpose or '(not provided)'}",
+    ]
+    composed_context = "\n\n".join(context_parts)
+
+    # 3) OpenAI reasoning (o3); identical inputs (no new Slack activity) reuse the last brief
+    model = MODEL_BY_EFFORT.get(effort, OPENAI_MODEL)
+    timeout = TIMEOUT_BY_EFFORT.get(effort, 240.0)
+    cache_key = _cache_key(model, effort, prompt, composed_context)
+    cached = _brief_cache.get(cache_key)
+    meta = BriefMeta(
+        channel_id=channel_id,
+        lookback_days=actual_days,
+        messages_limit=limit,
+        attendees_found=len(contacts),
+        effort=effort,
+        model=model,
+    )
+    if "text/event-stream" in req.headers.get("accept", ""):
+        # Clients that accept SSE get the brief as it is written, then the meta
+        async def brief_events() -> AsyncIterator[str]:
+            try:
+                text = cached
+                if text is not None:
+                    yield _sse("delta", {"text": text})
+                else:
+                    parts = []
+                    async for delta in _with_deadline(ask_o3_stream(prompt, composed_context, effort=effort, model=model), timeout):
+                        parts.append(delta)
+                        yield _sse("delta", {"text": delta})
+                    text = "".join(parts)
+                    if text:
+                        _brief_cache.set(cache_key, text)
+                    else:
+                        text = NO_TEXT_OUTPUT
+                        yield _sse("delta", {"text": text})
+                yield _sse("done", {"meta": meta, "brief_html": _report_html(text)})
+            except asyncio.TimeoutError:
+                yield _sse("error", {"detail": "OpenAI API error: brief generation timed out"})
+            except Exception as e:
+                print(f"Streaming brief failed: {e}")
+                detail = e.detail if isinstance(e, HTTPException) else str(e)
+                yield _sse("error", {"detail": f"Brief generation failed: {detail}"})
+
+        return StreamingResponse(
+            brief_events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
-    # 3) OpenAI reasoning (o3)
-    text = await asyncio.wait_for(ask_o3(prompt, composed_context, effort=effort), timeout=240.0)
-
-    return JSONResponse({
-        "brief_markdown": text,
-        "meta": {
-            "channel_id": channel_id,
-            "lookback_days": actual_days,
-            "messages_limit": limit,
-            "attendees_found": len(contacts),
-            "effort": effort,
-        }
-    })
+    text = cached
+    if text is None:
+        text = await asyncio.wait_for(ask_o3(prompt, composed_context, effort=effort, model=model), timeout=timeout)
+        if text:
+            _brief_cache.set(cache_key, text)
+        else:
+            text = NO_TEXT_OUTPUT
+
+    return ORJSONResponse({"brief_markdown": text, "meta": meta})
 
 ###############################################
 # Local dev entrypoint
 ###############################################
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app:app", host="0.0.0.0", port=int(os.getenv("PORT", "3000")), reload=True)
+    # This is also the Render start command, so reload is opt-in for local dev.
+    # uvicorn[standard] provides uvloop and httptools, which "auto" selects where supported.
+    # Caches and the HubSpot rate limiter are per process, so extra workers are opt-in too.
+    reload = os.getenv("RELOAD", "0") == "1"
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "3000")),
+        workers=1 if reload else int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="auto",
+        http="auto",
+        access_log=False,
+        reload=reload,
+    )
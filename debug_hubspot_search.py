@@ -3,13 +3,17 @@
 Debug HubSpot search to understand why Peter Secor isn't being found.
 """
 
-import requests
+import httpx
 import json
 import os
 
 BASE_URL = "https://mtgprep-executive-brief.onrender.com"
 HUBSPOT_TOKEN = os.getenv("HUBSPOT_TOKEN") or os.getenv("HUBSPOT_PRIVATE_APP_TOKEN")
 
+# One pooled HTTP/2 client for both hosts; the HubSpot token is sent per request so it
+# never reaches the app
+_client = httpx.Client(http2=True, timeout=60.0)
+
 def debug_peter_secor_hubspot():
     """Debug why Peter Secor isn't found in HubSpot search."""
     print("🔍 Debugging Peter Secor HubSpot Search")
@@ -31,7 +35,7 @@ def debug_peter_secor_hubspot():
         }
         
         # Get the specific contact
-        response = requests.get(
+        response = _client.get(
             f"https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}",
             headers=headers,
             timeout=30
@@ -79,7 +83,7 @@ def debug_peter_secor_hubspot():
                 
                 print(f"\n🧪 Testing app search with exact stored values...")
                 
-                app_response = requests.post(
+                app_response = _client.post(
                     f"{BASE_URL}/api/bd/research-attendees",
                     json=test_payload,
                     timeout=60
@@ -90,7 +94,7 @@ def debug_peter_secor_hubspot():
                     researched = app_data.get('researched_attendees', [])
                     
                     if researched and researched[0].get('hubspot_contact'):
-                        found_id = researched[0]['hubspot_contact'].get('_id') or researched[0]['hubspot_contact'].get('id')
+                        found_id = researched[0]['hubspot_contact'].get('id')
                         print(f"✅ App found contact! ID: {found_id}")
                         if str(found_id) == contact_id:
                             print("🎉 PERFECT MATCH! Search is working correctly.")
@@ -111,7 +115,7 @@ def debug_peter_secor_hubspot():
                 
         else:
             print(f"❌ Failed to fetch contact: {response.status_code}")
-            print(f"Response: {response.text[:200]}...")
+            print(f"Response: {response.content[:200].decode('utf-8', 'replace')}...")
             return False
             
     except Exception as e:
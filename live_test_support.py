@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the live test scripts: the verbosity flag, queued logging and the HTTP/2 client.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+# Per-step diagnostics only show with MTGPREP_TEST_VERBOSE=1; results and the summary always do
+VERBOSE = os.environ.get("MTGPREP_TEST_VERBOSE", "0") == "1"
+
+# The tests run on worker threads, so their output goes through a queue and a single
+# listener thread writes it to stdout instead of each thread blocking on print().
+# The listener runs from import until interpreter exit, so records are written (and
+# flushed at exit) however the test functions are invoked
+_log_queue = queue.SimpleQueue()
+_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_listener.start()
+atexit.register(_listener.stop)
+
+def get_logger(name):
+    """A script's logger, writing through the shared queue."""
+    log = logging.getLogger(name)
+    log.setLevel(logging.DEBUG if VERBOSE else logging.INFO)
+    log.propagate = False
+    if not log.handlers:
+        log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    return log
+
+def new_client(**kwargs):
+    """One pooled HTTP/2 client per script, so requests share a multiplexed connection
+    (and one TLS handshake) to the app."""
+    return httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True, retries=2, limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        ),
+        timeout=httpx.Timeout(180.0),
+        **kwargs,
+    )
+
+_log = get_logger(__name__)
+
+def _timed(test_name, test_func):
+    start_time = time.perf_counter()
+    success = test_func()
+    duration = time.perf_counter() - start_time
+    _log.info(f"⏱️  {test_name} duration: {duration:.2f}s")
+    return test_name, success, duration
+
+def run_tests(title, tests, width, success_lines, failure_line):
+    """Run independent (name, func) tests side by side, log the summary and return whether all passed."""
+    _log.info(title)
+    _log.info("=" * width)
+    for test_name, _ in tests:
+        _log.info(f"\n📋 Running: {test_name}")
+    _log.info("=" * width)
+    
+    # The tests are independent and network-bound, so they run side by side
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        results = list(executor.map(lambda t: _timed(*t), tests))
+    
+    # Summary, logged as one record once the workers are done
+    summary = [f"\n{'=' * width}", "📊 TEST RESULTS SUMMARY", "=" * width]
+    
+    passed = 0
+    total = len(results)
+    
+    for test_name, success, duration in results:
+        status = "✅ PASS" if success else "❌ FAIL"
+        summary.append(f"{status} | {test_name:<30} | {duration:>6.2f}s")
+        if success:
+            passed += 1
+    
+    summary.append("-" * width)
+    summary.append(f"Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
+    summary.extend(success_lines if passed == total else [failure_line])
+    
+    _log.info("\n".join(summary))
+    return passed == total
@@ -3,6 +3,8 @@
 Show a sample of the full prompt that gets sent to OpenAI for BD intelligence reports.
 """
 
+import textwrap
+
 # Sample data that would typically come from the UI
 sample_company = "TechFlow Solutions"
 sample_industry = "SaaS"
@@ -30,7 +32,7 @@ sample_researched_attendees = [
         "email": "david@techflow.com",
         "linkedin_url": "https://linkedin.com/in/davidrodriguez",
         "linkedin_snippet": "CTO focused on scalable technology infrastructure and data analytics platforms for SaaS companies.",
-        "hubspot_contact": {"_id": "123456789", "firstname": "David", "lastname": "Rodriguez", "company": "TechFlow Solutions"},
+        "hubspot_contact": {"id": "123456789", "firstname": "David", "lastname": "Rodriguez", "company": "TechFlow Solutions"},
         "background_research": {
             "background_info": [
                 {"title": "David Rodriguez - Technical Leadership", "snippet": "Technology leader with expertise in building analytics platforms..."}
@@ -98,41 +100,44 @@ CLIENT SUCCESS EXAMPLES:
 [Additional prompt sections about output format, guardrails, etc...]
 """
 
+_ATTENDEE_TEMPLATE = textwrap.dedent("""\
+    ### {name}
+    **Title:** {title}
+    **Email:** {email}
+    **LinkedIn:** {linkedin_url}
+    **HubSpot Status:** {hubspot_status}
+    **Professional Background:**
+    - {linkedin_snippet}
+""")
+
+def _attendee_profile(attendee):
+    """Research context block for one attendee profile."""
+    if attendee['hubspot_contact']:
+        contact_id = attendee['hubspot_contact'].get('id', 'N/A')
+        hubspot_status = f"Existing contact found (ID: {contact_id})"
+    else:
+        hubspot_status = "Not in HubSpot"
+    return _ATTENDEE_TEMPLATE.format(hubspot_status=hubspot_status, **attendee)
+
 def build_research_context():
     """Build the research context that gets sent with the prompt."""
-    research_sections = []
-    
-    # Company overview
-    research_sections.append("## Company Overview Research")
-    research_sections.append("**TechFlow Solutions - SaaS Platform Overview**")
-    research_sections.append("Source: https://techflow.com")
-    research_sections.append("B2B SaaS company providing workflow automation tools. Recent funding round of $25M. Focus on enterprise customers. Struggling with trial-to-paid conversion rates...")
-    research_sections.append("")
-    
-    # Recent news
-    research_sections.append("## Recent News & Developments")
-    research_sections.append("**TechFlow Solutions Raises $25M Series B**")
-    research_sections.append("Source: https://techcrunch.com/example")
-    research_sections.append("Company raised Series B to accelerate product development and improve customer conversion metrics...")
-    research_sections.append("")
-    
-    # Attendee profiles
-    research_sections.append("## Meeting Attendee Profiles")
-    for attendee in sample_researched_attendees:
-        research_sections.append(f"### {attendee['name']}")
-        research_sections.append(f"**Title:** {attendee['title']}")
-        research_sections.append(f"**Email:** {attendee['email']}")
-        research_sections.append(f"**LinkedIn:** {attendee['linkedin_url']}")
-        
-        if attendee['hubspot_contact']:
-            contact_id = attendee['hubspot_contact'].get('_id', 'N/A')
-            research_sections.append(f"**HubSpot Status:** Existing contact found (ID: {contact_id})")
-        else:
-            research_sections.append("**HubSpot Status:** Not in HubSpot")
-        
-        research_sections.append("**Professional Background:**")
-        research_sections.append(f"- {attendee['linkedin_snippet']}")
-        research_sections.append("")
+    research_sections = [
+        # Company overview
+        "## Company Overview Research",
+        "**TechFlow Solutions - SaaS Platform Overview**",
+        "Source: https://techflow.com",
+        "B2B SaaS company providing workflow automation tools. Recent funding round of $25M. Focus on enterprise customers. Struggling with trial-to-paid conversion rates...",
+        "",
+        # Recent news
+        "## Recent News & Developments",
+        "**TechFlow Solutions Raises $25M Series B**",
+        "Source: https://techcrunch.com/example",
+        "Company raised Series B to accelerate product development and improve customer conversion metrics...",
+        "",
+        # Attendee profiles
+        "## Meeting Attendee Profiles",
+    ]
+    research_sections.extend(_attendee_profile(a) for a in sample_researched_attendees)
     
     return "\n".join(research_sections)
 
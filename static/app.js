@@ -0,0 +1,208 @@
+const DEBUG = false;  // flip on to trace channel loading in devtools
+const channelSel = document.getElementById('channel');
+const out = document.getElementById('out');
+const statusEl = document.getElementById('status');
+const runBtn = document.getElementById('run');
+const limitEl = document.getElementById('limit');
+const daysEl = document.getElementById('days');
+const effortEl = document.getElementById('effort');
+const promptEl = document.getElementById('prompt');
+const attendeesEl = document.getElementById('attendees');
+const purposeEl = document.getElementById('purpose');
+
+// Status text is written at most once per frame; the latest message wins
+let pendingStatus = null;
+function setStatus(text){
+  const scheduled = pendingStatus !== null;
+  pendingStatus = text;
+  if (!scheduled){
+    requestAnimationFrame(() => { statusEl.textContent = pendingStatus; pendingStatus = null; });
+  }
+}
+
+// Bold, italic and inline code in a single pass over each paragraph line; bold and
+// italic text is run through the same rules again so it can hold code or emphasis
+const INLINE_RE = /\*\*(.*?)\*\*|\*(.*?)\*|`(.*?)`/g;
+const RE_OL = /^\d+\. /;
+const HTML_ESCAPE_RE = /[&<>"]/g;
+const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'};
+
+function inlineTag(_, b, i, c) {
+  return b !== undefined ? '<strong>' + b.replace(INLINE_RE, inlineTag) + '</strong>'
+    : i !== undefined ? '<em>' + i.replace(INLINE_RE, inlineTag) + '</em>'
+    : '<code>' + c + '</code>';
+}
+
+function parseMarkdown(text) {
+  // Simple markdown parser: one switch on the first character picks the block type
+  const html = [];
+  let listTag = null;  // 'ul' or 'ol' while a list is open
+
+  // Escaped up front: model output can quote raw HTML from scraped snippets
+  for (const line of text.replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]).split('\n')) {
+    let block = null, item = null, nextList = null;
+    const code = line.charCodeAt(0);
+    switch (code) {
+      case 35:  // '#'
+        if (line.startsWith('### ')) block = '<h3>' + line.substring(4) + '</h3>';
+        else if (line.startsWith('## ')) block = '<h2>' + line.substring(3) + '</h2>';
+        else if (line.startsWith('# ')) block = '<h1>' + line.substring(2) + '</h1>';
+        break;
+      case 45:  // '-'
+      case 42:  // '*'
+        if (line.charCodeAt(1) === 32) { nextList = 'ul'; item = line.substring(2); }
+        break;
+      default:
+        if (code >= 48 && code <= 57 && RE_OL.test(line)) { nextList = 'ol'; item = line.replace(RE_OL, ''); }
+    }
+
+    // Close or switch lists as soon as the block type changes
+    if (nextList !== listTag) {
+      if (listTag) html.push('</' + listTag + '>');
+      if (nextList) html.push('<' + nextList + '>');
+      listTag = nextList;
+    }
+    if (item !== null) html.push('<li>' + item + '</li>');
+    else if (block !== null) html.push(block);
+    else if (line.trim()) html.push('<p>' + line.replace(INLINE_RE, inlineTag) + '</p>');
+  }
+  if (listTag) html.push('</' + listTag + '>');
+  return html.join('');
+}
+
+const CHANNELS_CACHE_KEY = 'channels_v1';
+const CHANNELS_CACHE_TTL_MS = 5 * 60 * 1000;
+
+function populateChannels(channels){
+  // Build all options off-DOM and swap them in with a single mutation;
+  // the private/public marker lives on the group label so each option is plain text.
+  // Grouping lists every private channel before the public ones; within a group the
+  // server's order is kept
+  const selected = channelSel.value;
+  const frag = document.createDocumentFragment();
+  const groups = {
+    priv: Object.assign(document.createElement('optgroup'), {label: '🔒 Private'}),
+    pub: Object.assign(document.createElement('optgroup'), {label: '# Public'}),
+  };
+  channels.forEach(c => {
+    const opt = document.createElement('option');
+    opt.value = c.id;
+    opt.textContent = c.name || c.id;
+    groups[c.is_private ? 'priv' : 'pub'].appendChild(opt);
+  });
+  Object.values(groups).forEach(g => { if (g.children.length) frag.appendChild(g); });
+  channelSel.replaceChildren(frag);
+  if (selected) channelSel.value = selected;
+}
+
+function cachedChannels(){
+  try{
+    const cached = JSON.parse(sessionStorage.getItem(CHANNELS_CACHE_KEY) || 'null');
+    if (cached && Date.now() - cached.t < CHANNELS_CACHE_TTL_MS) return cached.channels;
+  }catch(e){}
+  return null;
+}
+
+async function loadChannels(){
+  // Render straight from the session cache, then refresh from Slack in the background
+  const cached = cachedChannels();
+  if (cached){
+    if (DEBUG) console.log('Rendering', cached.length, 'cached channels');
+    populateChannels(cached);
+  } else {
+    setStatus('Loading Slack channels…');
+  }
+  if (DEBUG) console.log('Starting to load channels...');
+  try{
+    const r = await fetch('/api/channels');
+    if (DEBUG) console.log('Fetch response status:', r.status, r.ok);
+    if(!r.ok){ throw new Error(await r.text()); }
+    const data = await r.json();
+    populateChannels(data.channels);
+    try{
+      sessionStorage.setItem(CHANNELS_CACHE_KEY, JSON.stringify({t: Date.now(), channels: data.channels}));
+    }catch(e){}
+    setStatus('');
+  }catch(e){
+    console.error('Channel loading error:', e);
+    if (!cached){
+      setStatus('Failed to load channels: ' + (e && e.message ? e.message : e));
+    }
+  }
+}
+
+// Set for the whole request so a second submission can't start a duplicate brief
+let runInFlight = false;
+
+async function run(){
+  if(runInFlight) return;
+  runInFlight = true;
+  requestAnimationFrame(() => { out.textContent = ''; });
+  setStatus('Running…');
+  runBtn.disabled = true;
+  try{
+    const body = {
+      channel_id: channelSel.value,
+      limit: parseInt(limitEl.value||'300',10),
+      lookback_days: parseInt(daysEl.value||'14',10),
+      effort: effortEl.value,
+      resolve_names: true,
+      prompt: promptEl.value,
+      attendee_emails: attendeesEl.value,
+      purpose: purposeEl.value,
+    };
+    const r = await fetch('/api/run', {
+      method:'POST',
+      headers:{'Content-Type':'application/json', 'Accept':'text/event-stream'},
+      body: JSON.stringify(body)
+    });
+    if(!r.ok){
+      const data = await r.json().catch(() => ({}));
+      throw new Error(data.detail || r.statusText);
+    }
+    setStatus('Writing…');
+    // Read SSE messages off the stream; brief text re-renders at most once per animation frame
+    const reader = r.body.getReader();
+    const dec = new TextDecoder();
+    let pending = '', buf = '', briefHtml = null, painting = false;
+    while(true){
+      const {value, done} = await reader.read();
+      if(done) break;
+      pending += dec.decode(value, {stream:true});
+      let sep;
+      while((sep = pending.indexOf('\n\n')) !== -1){
+        const message = pending.slice(0, sep);
+        pending = pending.slice(sep + 2);
+        let event = 'message', data = '';
+        for(const line of message.split('\n')){
+          if(line.startsWith('event: ')) event = line.slice(7);
+          else if(line.startsWith('data: ')) data += line.slice(6);
+        }
+        const payload = data ? JSON.parse(data) : {};
+        if(event === 'delta'){
+          buf += payload.text;
+          if(!painting){
+            painting = true;
+            requestAnimationFrame(() => { out.innerHTML = parseMarkdown(buf); painting = false; });
+          }
+        }else if(event === 'done'){
+          briefHtml = payload.brief_html || null;
+        }else if(event === 'error'){
+          throw new Error(payload.detail || 'Brief generation failed');
+        }
+      }
+    }
+    setStatus('Done.');
+    // Queued behind the clear and any in-flight partial render, so the full text lands last.
+    // The server's sanitized HTML replaces the quick streaming preview when it's available.
+    requestAnimationFrame(() => { out.innerHTML = briefHtml || parseMarkdown(buf || '(no output)'); });
+  }catch(e){
+    setStatus('Error: ' + (e && e.message ? e.message : e));
+  }finally{
+    runInFlight = false;
+    runBtn.disabled = false;
+  }
+}
+
+runBtn.addEventListener('click', run);
+loadChannels();
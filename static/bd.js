@@ -0,0 +1,484 @@
+const out = document.getElementById('out');
+const statusEl = document.getElementById('status');
+const progressEl = document.getElementById('research-progress');
+const progressSteps = document.getElementById('progress-steps');
+const attendeeTpl = document.getElementById('attendee-tpl');
+const runBtn = document.getElementById('run');
+const researchBtn = document.getElementById('research-attendees');
+const researchStatusEl = document.getElementById('research-status');
+const companyEl = document.getElementById('company');
+const industryEl = document.getElementById('industry');
+const meetingContextEl = document.getElementById('meeting_context');
+const effortEl = document.getElementById('effort');
+const promptEl = document.getElementById('prompt');
+const attendeesList = document.getElementById('attendees-list');
+const researchPhaseEl = document.getElementById('research-phase');
+const intelligencePhaseEl = document.getElementById('intelligence-phase');
+const addAllHubspotBtn = document.getElementById('add-all-hubspot');
+// Status text is written at most once per frame; the latest message wins
+let pendingStatus = null;
+function setStatus(text){
+  const scheduled = pendingStatus !== null;
+  pendingStatus = text;
+  if (!scheduled){
+    requestAnimationFrame(() => { statusEl.textContent = pendingStatus; pendingStatus = null; });
+  }
+}
+let attendeeCounter = 0;
+
+// Attendee rows in display order plus an id index, so lookups never walk the DOM
+const attendeeRows = [];
+const attendeeRowsById = new Map();
+
+function buildAttendeeRow(name, title, email) {
+  attendeeCounter++;
+  const id = attendeeCounter;
+
+  // Clone the static skeleton and keep references to the parts we touch later
+  const el = attendeeTpl.content.firstElementChild.cloneNode(true);
+  el.id = `attendee-${id}`;
+  const row = {
+    id: id,
+    el: el,
+    fields: {
+      name: el.querySelector('[data-field="name"]'),
+      title: el.querySelector('[data-field="title"]'),
+      company: el.querySelector('[data-field="company"]'),
+      email: el.querySelector('[data-field="email"]'),
+    },
+    statusEl: el.querySelector('[data-role="status"]'),
+    actionsEl: el.querySelector('[data-role="actions"]'),
+    hubspotBtn: el.querySelector('.hubspot-btn'),
+    removeBtn: el.querySelector('.remove'),
+    resultsEl: el.querySelector('.research-results'),
+  };
+  row.fields.name.value = name;
+  row.fields.title.value = title;
+  row.fields.email.value = email;
+  row.hubspotBtn.onclick = () => addToHubSpot(id);
+  row.removeBtn.onclick = () => removeAttendee(id);
+  return row;
+}
+
+function updateRemoveButtons() {
+  // The last remaining attendee can't be removed
+  const display = attendeeRows.length === 1 ? 'none' : '';
+  attendeeRows.forEach(row => { row.removeBtn.style.display = display; });
+}
+
+function addAttendees(entries) {
+  // Build every new row off-DOM and insert them with a single append
+  const frag = document.createDocumentFragment();
+  entries.forEach(({name = '', title = '', email = ''}) => {
+    const row = buildAttendeeRow(name, title, email);
+    attendeeRows.push(row);
+    attendeeRowsById.set(row.id, row);
+    frag.appendChild(row.el);
+  });
+  attendeesList.appendChild(frag);
+  updateRemoveButtons();
+}
+
+function addAttendee(name = '', title = '', email = '') {
+  addAttendees([{name, title, email}]);
+}
+
+function removeAttendee(id) {
+  const row = attendeeRowsById.get(id);
+  if (!row) return;
+  row.el.remove();
+  attendeeRowsById.delete(id);
+  attendeeRows.splice(attendeeRows.indexOf(row), 1);
+  updateRemoveButtons();
+}
+
+function namedAttendeeRows() {
+  return attendeeRows.filter(row => row.fields.name.value.trim());
+}
+
+function getAttendees(rows = namedAttendeeRows()) {
+  return rows.map(row => ({
+    name: row.fields.name.value.trim(),
+    title: row.fields.title.value.trim(),
+    company: row.fields.company.value.trim(),
+    email: row.fields.email.value.trim()
+  }));
+}
+
+let attendeeResearchData = [];
+
+// Guards against a second submission while one is already running; the disabled
+// buttons cover clicks, these cover re-entry from any other path
+let researchInFlight = false;
+let runInFlight = false;
+const hubspotInFlight = new Set();
+
+// Add-to-HubSpot clicks within this window go out as one batch request
+const HUBSPOT_BATCH_WINDOW_MS = 500;
+let hubspotQueue = [];
+let hubspotFlushTimer = null;
+
+function addToHubSpot(attendeeId) {
+  if (hubspotInFlight.has(attendeeId)) return;
+  const attendee = attendeeResearchData.find(a => a.ui_id === attendeeId);
+  if (!attendee) return;
+
+  const row = attendeeRowsById.get(attendeeId);
+  if (!row) return;
+  hubspotInFlight.add(attendeeId);
+
+  row.statusEl.textContent = 'Adding to HubSpot...';
+  row.hubspotBtn.disabled = true;
+
+  hubspotQueue.push({attendee: attendee, row: row});
+  if (!hubspotFlushTimer) {
+    hubspotFlushTimer = setTimeout(flushHubSpotQueue, HUBSPOT_BATCH_WINDOW_MS);
+  }
+}
+
+function addAllToHubSpot() {
+  for (const attendee of attendeeResearchData) {
+    if (!attendee.hubspot_contact) addToHubSpot(attendee.ui_id);
+  }
+  // Everything is already queued, so there's nothing to wait for
+  flushHubSpotQueue();
+}
+
+function updateAddAllButton() {
+  const pending = attendeeResearchData.some(a => !a.hubspot_contact);
+  addAllHubspotBtn.style.display = pending ? 'inline-block' : 'none';
+}
+
+function flushHubSpotQueue() {
+  clearTimeout(hubspotFlushTimer);
+  hubspotFlushTimer = null;
+  const batch = hubspotQueue;
+  hubspotQueue = [];
+  if (batch.length === 0) return;
+
+  const failed = ({row}) => {
+    row.statusEl.textContent = 'HubSpot Error';
+    row.hubspotBtn.disabled = false;
+  };
+
+  fetch('/api/bd/add-to-hubspot-batch', {
+    method: 'POST',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify({
+      attendees: batch.map(({attendee}) => ({
+        name: attendee.name,
+        title: attendee.title,
+        company: attendee.company,
+        email: attendee.email,
+        linkedin_url: attendee.linkedin_url
+      }))
+    })
+  })
+  .then(response => response.json())
+  .then(data => {
+    const results = data.results || [];
+    batch.forEach((item, i) => {
+      const result = results[i];
+      if (result && result.success) {
+        item.row.statusEl.textContent = 'Added to HubSpot';
+        item.row.statusEl.className = 'attendee-status status-found';
+        item.row.hubspotBtn.style.display = 'none';
+        item.attendee.hubspot_contact = {id: result.contact_id, created: true};
+      } else {
+        failed(item);
+      }
+    });
+  })
+  .catch(() => { batch.forEach(failed); })
+  .finally(() => {
+    for (const {attendee} of batch) hubspotInFlight.delete(attendee.ui_id);
+    updateAddAllButton();
+  });
+}
+
+async function researchAttendees() {
+  if (researchInFlight) return;
+  const rows = namedAttendeeRows();
+  const attendees = getAttendees(rows);
+  if (attendees.length === 0) {
+    alert('Please add at least one attendee');
+    return;
+  }
+
+  const targetCompany = companyEl.value.trim();
+  if (!targetCompany) {
+    alert('Please enter the target company name');
+    return;
+  }
+
+  researchInFlight = true;
+  researchBtn.disabled = true;
+  researchStatusEl.textContent = 'Researching attendees...';
+
+  attendeeResearchData = [];
+
+  try {
+    const response = await fetch('/api/bd/research-attendees', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({
+        attendees: attendees,
+        target_company: targetCompany,
+        check_hubspot: true
+      })
+    });
+
+    const data = await response.json();
+
+    if (response.ok) {
+      attendeeResearchData = data.researched_attendees;
+
+      // Work out every row's final state first, without touching the DOM
+      const updates = attendeeResearchData.map((attendee, index) => {
+        // The server keeps request order and skips the same nameless rows we did
+        const row = rows[index];
+        attendee.ui_id = row.id;
+
+        let statusText = attendee.linkedin_url ? '✓ LinkedIn Found' : 'No LinkedIn Found';
+        let statusClass = attendee.linkedin_url ? 'status-researched' : 'status-unknown';
+
+        // Build research results HTML
+        let researchHtml = '';
+
+        // HubSpot Status
+        if (attendee.hubspot_contact) {
+          researchHtml += `
+            <div class="hubspot-status found">
+              ✅ <strong>Found in HubSpot</strong> (Contact ID: ${attendee.hubspot_contact.id || 'N/A'})
+            </div>
+          `;
+          statusText += ', In HubSpot';
+          statusClass = 'status-found';
+        } else {
+          researchHtml += `
+            <div class="hubspot-status not-found">
+              ℹ️ <strong>Not in HubSpot</strong> - Add button will appear below
+            </div>
+          `;
+        }
+
+        // LinkedIn Information
+        if (attendee.linkedin_url) {
+          researchHtml += `
+            <a href="${attendee.linkedin_url}" target="_blank" class="linkedin-link">
+              🔗 View LinkedIn Profile
+            </a>
+          `;
+
+          if (attendee.linkedin_snippet) {
+            researchHtml += `
+              <div class="linkedin-snippet">
+                <strong>${attendee.linkedin_title || 'LinkedIn Profile'}</strong><br>
+                ${attendee.linkedin_snippet}
+              </div>
+            `;
+          }
+        } else {
+          researchHtml += `
+            <div class="linkedin-snippet" style="background: var(--cro-yellow-100); border-color: var(--cro-yellow-400);">
+              ⚠️ LinkedIn profile not found. You may want to search manually or verify the name/company.
+            </div>
+          `;
+        }
+
+        return {
+          row: row,
+          statusText: statusText,
+          statusClass: 'attendee-status ' + statusClass,
+          researchHtml: researchHtml,
+          // Show HubSpot button if not in HubSpot (email not required)
+          showHubspot: !attendee.hubspot_contact,
+          company: attendee.company && !row.fields.company.value ? attendee.company : null,
+        };
+      });
+
+      // Then apply all of them in one frame, one write per element
+      requestAnimationFrame(() => {
+        for (const u of updates) {
+          if (u.company) u.row.fields.company.value = u.company;
+          u.row.statusEl.textContent = u.statusText;
+          u.row.statusEl.className = u.statusClass;
+          if (u.showHubspot) {
+            u.row.hubspotBtn.style.display = 'inline-block';
+            u.row.actionsEl.style.display = 'flex';
+          }
+          u.row.resultsEl.innerHTML = u.researchHtml;
+          u.row.resultsEl.className = 'research-results show';
+        }
+
+        researchStatusEl.textContent = `Research complete! Found ${data.linkedin_found} LinkedIn profiles.`;
+        updateAddAllButton();
+
+        // Show Phase 2
+        researchPhaseEl.style.display = 'none';
+        intelligencePhaseEl.style.display = 'block';
+      });
+
+    } else {
+      throw new Error(data.detail || 'Research failed');
+    }
+
+  } catch (error) {
+    researchStatusEl.textContent = 'Research failed: ' + error.message;
+  } finally {
+    researchInFlight = false;
+    researchBtn.disabled = false;
+  }
+}
+
+// Bold, italic and inline code in a single pass over each paragraph line; bold and
+// italic text is run through the same rules again so it can hold code or emphasis
+const INLINE_RE = /\*\*(.*?)\*\*|\*(.*?)\*|`(.*?)`/g;
+const RE_OL = /^\d+\. /;
+const HTML_ESCAPE_RE = /[&<>"]/g;
+const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'};
+
+function inlineTag(_, b, i, c) {
+  return b !== undefined ? '<strong>' + b.replace(INLINE_RE, inlineTag) + '</strong>'
+    : i !== undefined ? '<em>' + i.replace(INLINE_RE, inlineTag) + '</em>'
+    : '<code>' + c + '</code>';
+}
+
+function parseMarkdown(text) {
+  // Simple markdown parser: one switch on the first character picks the block type
+  const html = [];
+  let listTag = null;  // 'ul' or 'ol' while a list is open
+
+  // Escaped up front: model output can quote raw HTML from scraped snippets
+  for (const line of text.replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]).split('\n')) {
+    let block = null, item = null, nextList = null;
+    const code = line.charCodeAt(0);
+    switch (code) {
+      case 35:  // '#'
+        if (line.startsWith('### ')) block = '<h3>' + line.substring(4) + '</h3>';
+        else if (line.startsWith('## ')) block = '<h2>' + line.substring(3) + '</h2>';
+        else if (line.startsWith('# ')) block = '<h1>' + line.substring(2) + '</h1>';
+        break;
+      case 45:  // '-'
+      case 42:  // '*'
+        if (line.charCodeAt(1) === 32) { nextList = 'ul'; item = line.substring(2); }
+        break;
+      default:
+        if (code >= 48 && code <= 57 && RE_OL.test(line)) { nextList = 'ol'; item = line.replace(RE_OL, ''); }
+    }
+
+    // Close or switch lists as soon as the block type changes
+    if (nextList !== listTag) {
+      if (listTag) html.push('</' + listTag + '>');
+      if (nextList) html.push('<' + nextList + '>');
+      listTag = nextList;
+    }
+    if (item !== null) html.push('<li>' + item + '</li>');
+    else if (block !== null) html.push(block);
+    else if (line.trim()) html.push('<p>' + line.replace(INLINE_RE, inlineTag) + '</p>');
+  }
+  if (listTag) html.push('</' + listTag + '>');
+  return html.join('');
+}
+
+function updateProgress(step) {
+  const stepEl = document.createElement('div');
+  stepEl.className = 'research-step';
+  stepEl.textContent = '✓ ' + step;
+  progressSteps.appendChild(stepEl);
+}
+
+async function run(){
+  if (runInFlight) return;
+  runInFlight = true;
+  requestAnimationFrame(() => { out.textContent = ''; });
+  setStatus('Generating intelligence report...');
+  progressEl.style.display = 'block';
+  progressSteps.innerHTML = '';
+  runBtn.disabled = true;
+
+  try{
+    if (attendeeResearchData.length === 0) {
+      throw new Error('Please research attendees first');
+    }
+
+    const body = {
+      company_name: companyEl.value,
+      industry: industryEl.value,
+      meeting_context: meetingContextEl.value,
+      effort: effortEl.value,
+      prompt: promptEl.value,
+      researched_attendees: attendeeResearchData
+    };
+
+    updateProgress('Generating intelligence report with researched attendee data...');
+
+    const r = await fetch('/api/bd/generate', {
+      method:'POST', 
+      headers:{'Content-Type':'application/json', 'Accept':'text/event-stream'}, 
+      body: JSON.stringify(body)
+    });
+    if(!r.ok){
+      const data = await r.json().catch(() => ({}));
+      throw new Error(data.detail || r.statusText);
+    }
+
+    // Read SSE messages off the stream; report text re-renders at most once per frame
+    const reader = r.body.getReader();
+    const dec = new TextDecoder();
+    let pending = '', markdown = '', reportHtml = null, painting = false;
+    for (;;) {
+      const {value, done} = await reader.read();
+      if (done) break;
+      pending += dec.decode(value, {stream:true});
+      let sep;
+      while ((sep = pending.indexOf('\n\n')) !== -1) {
+        const message = pending.slice(0, sep);
+        pending = pending.slice(sep + 2);
+        let event = 'message', data = '';
+        for (const line of message.split('\n')) {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          else if (line.startsWith('data: ')) data += line.slice(6);
+        }
+        const payload = data ? JSON.parse(data) : {};
+        if (event === 'status') {
+          updateProgress(payload.message);
+        } else if (event === 'delta') {
+          markdown += payload.text;
+          if (!painting) {
+            painting = true;
+            requestAnimationFrame(() => { out.innerHTML = parseMarkdown(markdown); painting = false; });
+          }
+        } else if (event === 'done') {
+          reportHtml = payload.report_html || null;
+        } else if (event === 'error') {
+          throw new Error(payload.detail || 'Report generation failed');
+        }
+      }
+    }
+
+    updateProgress('Intelligence report generated successfully!');
+    setStatus('Done.');
+    // Queued behind any in-flight partial render, so the full report lands last. The
+    // server's sanitized HTML replaces the quick streaming preview when it's available.
+    requestAnimationFrame(() => { out.innerHTML = reportHtml || parseMarkdown(markdown || '(no output)'); });
+
+    setTimeout(() => {
+      progressEl.style.display = 'none';
+    }, 3000);
+
+  }catch(e){
+    setStatus('Error: ' + (e && e.message ? e.message : e));
+    progressEl.style.display = 'none';
+  }finally{
+    runInFlight = false;
+    runBtn.disabled = false;
+  }
+}
+
+// Initialize with one attendee
+addAttendee();
+
+researchBtn.addEventListener('click', researchAttendees);
+runBtn.addEventListener('click', run);
+addAllHubspotBtn.addEventListener('click', addAllToHubSpot);
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test Accept-Encoding negotiation for the precompressed pages, in process with FastAPI's TestClient.
+"""
+
+from fastapi.testclient import TestClient
+
+from app import app
+
+_client = TestClient(app)
+
+def _encoding_for(accept_encoding):
+    response = _client.get("/", headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == 200
+    return response.headers.get("content-encoding", "identity")
+
+def test_prefers_brotli():
+    assert _encoding_for("gzip, br") == "br"
+
+def test_refused_brotli_falls_back_to_gzip():
+    assert _encoding_for("br;q=0, gzip") == "gzip"
+
+def test_refused_gzip_falls_back_to_identity():
+    assert _encoding_for("identity, gzip;q=0") == "identity"
+
+def test_highest_q_value_wins():
+    assert _encoding_for("br;q=0.4, gzip;q=0.8") == "gzip"
+
+def test_wildcard_accepts_any_coding():
+    assert _encoding_for("*") == "br"
+    assert _encoding_for("*;q=0, identity") == "identity"
+
+def test_no_header_gets_identity():
+    assert _encoding_for("") == "identity"
+
+if __name__ == "__main__":
+    tests = [name for name in sorted(globals()) if name.startswith("test_")]
+    for name in tests:
+        globals()[name]()
+        print(f"✅ PASS | {name}")
+    print(f"Results: {len(tests)}/{len(tests)} tests passed")
@@ -3,52 +3,66 @@
 Test the enhanced research validation UI with LinkedIn snippets and HubSpot status.
 """
 
-import requests
-import json
+import asyncio
+import re
+import httpx
+import orjson
 import time
 
 BASE_URL = "https://mtgprep-executive-brief.onrender.com"
 
-def test_enhanced_research_ui():
+# Shared across both tests so they reuse one HTTP/2 connection to the app
+_client = httpx.AsyncClient(http2=True, timeout=60.0)
+
+def _print_error_detail(response):
+    """Print the API's error detail, or the start of the raw body when it isn't JSON."""
+    try:
+        detail = orjson.loads(response.content).get('detail', 'Unknown error')
+    except (orjson.JSONDecodeError, AttributeError):
+        print(f"Error response: {response.content[:200].decode('utf-8', 'replace')}...")
+    else:
+        print(f"Error: {detail}")
+
+# Test with a real LinkedIn profile that should be findable
+RESEARCH_PAYLOAD = {
+    "attendees": (
+        {
+            "name": "Daniel W. Winey",
+            "title": "FAIA, IIDA, LEED BDC",
+            "company": "Gensler",
+            "email": ""
+        },
+        {
+            "name": "Sarah Chen",
+            "title": "VP of Marketing",
+            "company": "TechCorp Solutions",
+            "email": "sarah@techcorp.com"
+        },
+    ),
+    "target_company": "Gensler",
+    "check_hubspot": True
+}
+
+async def _check_enhanced_research_ui():
     """Test the enhanced research UI with real LinkedIn profile example."""
     print("🔍 Testing Enhanced Research Validation UI")
     print("=" * 50)
     
-    # Test with a real LinkedIn profile that should be findable
-    attendees_payload = {
-        "attendees": [
-            {
-                "name": "Daniel W. Winey",
-                "title": "FAIA, IIDA, LEED BDC",
-                "company": "Gensler",
-                "email": ""
-            },
-            {
-                "name": "Sarah Chen",
-                "title": "VP of Marketing",
-                "company": "TechCorp Solutions",
-                "email": "sarah@techcorp.com"
-            }
-        ],
-        "target_company": "Gensler",
-        "check_hubspot": True
-    }
-    
     print("🔍 Testing research with known LinkedIn profile...")
     print("Searching for:")
-    for i, attendee in enumerate(attendees_payload["attendees"], 1):
+    for i, attendee in enumerate(RESEARCH_PAYLOAD["attendees"], 1):
         print(f"  {i}. {attendee['name']} - {attendee['title']} at {attendee['company']}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        response = requests.post(
+        response = await _client.post(
             f"{BASE_URL}/api/bd/research-attendees",
-            json=attendees_payload,
+            json=RESEARCH_PAYLOAD,
             timeout=120
         )
         
-        research_duration = time.time() - start_time
+        research_duration = time.perf_counter() - start_time
         
         if response.status_code == 200:
             research_data = response.json()
@@ -73,7 +87,9 @@ def test_enhanced_research_ui():
                     if attendee.get('linkedin_title'):
                         print(f"     📝 LinkedIn Title: {attendee['linkedin_title']}")
                     if attendee.get('linkedin_snippet'):
-                        snippet = attendee['linkedin_snippet'][:100] + "..." if len(attendee['linkedin_snippet']) > 100 else attendee['linkedin_snippet']
+                        snippet = attendee['linkedin_snippet']
+                        if len(snippet) > 100:
+                            snippet = f"{snippet[:100]}..."
                         print(f"     📄 Snippet: {snippet}")
                 else:
                     print(f"     ❌ LinkedIn: Not found")
@@ -103,30 +119,30 @@ def test_enhanced_research_ui():
                 
         else:
             print(f"❌ Research failed: {response.status_code}")
-            try:
-                error_data = response.json()
-                print(f"Error: {error_data.get('detail', 'Unknown error')}")
-            except:
-                print(f"Error response: {response.text[:200]}...")
+            _print_error_detail(response)
             return False
             
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("⏰ Request timed out")
         return False
     except Exception as e:
         print(f"❌ Test failed with exception: {str(e)}")
         return False
 
-def test_ui_features():
+async def _check_ui_features():
     """Test that the BD page contains the new UI elements."""
     print("\n🎨 Testing Enhanced UI Elements")
     print("-" * 35)
     
     try:
-        response = requests.get(f"{BASE_URL}/bd")
+        response = await _client.get(f"{BASE_URL}/bd")
         
         if response.status_code == 200:
             content = response.text
+            # Result markup is rendered by the page's deferred scripts, so check those too
+            srcs = re.findall(r'<script[^>]+src="?([^"\s>]+)', content)
+            scripts = await asyncio.gather(*(_client.get(f"{BASE_URL}{src}") for src in srcs))
+            content += "".join(script.text for script in scripts)
             
             # Check for new CSS classes and elements
             ui_features = [
@@ -160,41 +176,50 @@ def test_ui_features():
         print(f"❌ UI test failed: {str(e)}")
         return False
 
+async def _timed(test_name, test_func):
+    start_time = time.perf_counter()
+    success = await test_func()
+    duration = time.perf_counter() - start_time
+    print(f"⏱️  {test_name} duration: {duration:.2f}s")
+    return test_name, success, duration
+
+async def _run_tests(tests):
+    # The tests are independent, so they run side by side over the shared client
+    try:
+        return await asyncio.gather(*(_timed(name, func) for name, func in tests))
+    finally:
+        await _client.aclose()
+
 if __name__ == "__main__":
     print("🚀 Testing Enhanced Research Validation Features")
     print("=" * 60)
     
     tests = [
-        ("Enhanced Research UI", test_enhanced_research_ui),
-        ("UI Feature Detection", test_ui_features)
+        ("Enhanced Research UI", _check_enhanced_research_ui),
+        ("UI Feature Detection", _check_ui_features)
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
+    for test_name, _ in tests:
         print(f"\n📋 Running: {test_name}")
-        print("=" * 60)
-        
-        start_time = time.time()
-        success = test_func()
-        duration = time.time() - start_time
-        
-        results.append((test_name, success, duration))
-        print(f"⏱️  Duration: {duration:.2f}s")
+    print("=" * 60)
+    
+    results = asyncio.run(_run_tests(tests))
     
     # Summary
-    print("\n" + "=" * 60)
+    print(f"\n{'=' * 60}")
     print("📊 TEST RESULTS SUMMARY")
     print("=" * 60)
     
     passed = 0
     total = len(results)
     
+    lines = []
     for test_name, success, duration in results:
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} | {test_name:<25} | {duration:>6.2f}s")
+        lines.append(f"{status} | {test_name:<25} | {duration:>6.2f}s")
         if success:
             passed += 1
+    print("\n".join(lines))
     
     print("-" * 60)
     print(f"Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
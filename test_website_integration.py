@@ -3,247 +3,224 @@
 Test the enhanced Cro Metrics website content integration and service mapping.
 """
 
-import requests
-import json
-import time
+import orjson
+
+from live_test_support import get_logger, new_client, run_tests
 
 BASE_URL = "https://mtgprep-executive-brief.onrender.com"
 
+log = get_logger(__name__)
+
+# Bodies are encoded with orjson up front, so the client labels them once
+_client = new_client(headers={"Content-Type": "application/json"})
+
+def _needles(*needles):
+    """Pair each needle with its lowercased form, computed once at import."""
+    return tuple((needle, needle.lower()) for needle in needles)
+
+# Cro Metrics services the report should map needs to
+SERVICES_TO_CHECK = _needles(
+    "Analytics",
+    "Conversion Rate Optimization",
+    "Creative Services",
+    "Customer Journey Analysis",
+    "Design and Build",
+    "Iris by Cro Metrics",
+    "Lifecycle and Email",
+    "Performance Marketing",
+)
+# Website metrics and client examples
+WEBSITE_ELEMENTS = _needles(
+    "$1B client impact",
+    "97.4% retention",
+    "10X ROI",
+    "Home Chef",
+    "Curology",
+    "Bombas",
+    "Iris platform",
+    "We Don't Guess, We Test",
+)
+# SaaS-specific content
+SAAS_INDICATORS = _needles(
+    "SaaS",
+    "subscription",
+    "trial-to-paid",
+    "churn",
+    "customer acquisition",
+    "retention",
+)
+
+def _mentions(needles, report_lower):
+    """The needles that appear in an already-lowercased report."""
+    return [needle for needle, needle_lower in needles if needle_lower in report_lower]
+
+# Test with a scenario that should trigger multiple service recommendations
+ECOMMERCE_PAYLOAD = {
+    "company_name": "RetailGrowth Corp",
+    "industry": "E-Commerce/Retail",
+    "meeting_context": "Strategic discussion about improving online conversion rates, email marketing performance, and customer analytics. They're struggling with cart abandonment and want to redesign their checkout flow.",
+    "effort": "high",
+    "researched_attendees": (
+        {
+            "name": "Jennifer Walsh",
+            "title": "VP of E-commerce",
+            "company": "RetailGrowth Corp",
+            "email": "jennifer@retailgrowth.com",
+            "linkedin_url": "https://linkedin.com/in/jenniferwalsh",
+            "linkedin_snippet": "VP of E-commerce focused on conversion optimization and customer experience",
+            "hubspot_contact": None,
+            "background_research": {}
+        },
+        {
+            "name": "Michael Torres",
+            "title": "Director of Email Marketing",
+            "company": "RetailGrowth Corp",
+            "email": "michael@retailgrowth.com",
+            "linkedin_url": "https://linkedin.com/in/michaeltorres",
+            "linkedin_snippet": "Email marketing expert with focus on lifecycle campaigns and retention",
+            "hubspot_contact": None,
+            "background_research": {}
+        },
+    )
+}
+
 def test_website_service_mapping():
     """Test that the AI maps customer needs to specific Cro Metrics services from the website."""
-    print("🌐 Testing Website Service Mapping")
-    print("=" * 40)
-    
-    # Test with a scenario that should trigger multiple service recommendations
-    test_payload = {
-        "company_name": "RetailGrowth Corp",
-        "industry": "E-Commerce/Retail",
-        "meeting_context": "Strategic discussion about improving online conversion rates, email marketing performance, and customer analytics. They're struggling with cart abandonment and want to redesign their checkout flow.",
-        "effort": "high",
-        "researched_attendees": [
-            {
-                "name": "Jennifer Walsh",
-                "title": "VP of E-commerce",
-                "company": "RetailGrowth Corp",
-                "email": "jennifer@retailgrowth.com",
-                "linkedin_url": "https://linkedin.com/in/jenniferwalsh",
-                "linkedin_snippet": "VP of E-commerce focused on conversion optimization and customer experience",
-                "hubspot_contact": None,
-                "background_research": {}
-            },
-            {
-                "name": "Michael Torres",
-                "title": "Director of Email Marketing",
-                "company": "RetailGrowth Corp",
-                "email": "michael@retailgrowth.com",
-                "linkedin_url": "https://linkedin.com/in/michaeltorres",
-                "linkedin_snippet": "Email marketing expert with focus on lifecycle campaigns and retention",
-                "hubspot_contact": None,
-                "background_research": {}
-            }
-        ]
-    }
+    log.info("🌐 Testing Website Service Mapping")
+    log.info("=" * 40)
     
-    print("🔍 Testing with e-commerce scenario that should trigger multiple services...")
-    print("   Expected services: CRO, Design & Build, Lifecycle & Email, Analytics")
+    log.debug("🔍 Testing with e-commerce scenario that should trigger multiple services...")
+    log.debug("   Expected services: CRO, Design & Build, Lifecycle & Email, Analytics")
     
     try:
-        response = requests.post(
+        response = _client.post(
             f"{BASE_URL}/api/bd/generate",
-            json=test_payload,
+            content=orjson.dumps(ECOMMERCE_PAYLOAD),
             timeout=180
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             report = data.get('report_markdown', '')
+            report_lower = report.lower()
             
-            print(f"✅ Intelligence report generated!")
-            print(f"📊 Report length: {len(report):,} characters")
+            log.info(f"✅ Intelligence report generated!")
+            log.debug(f"📊 Report length: {len(report):,} characters")
             
             # Check for specific Cro Metrics services mentioned
-            services_to_check = [
-                "Analytics",
-                "Conversion Rate Optimization", 
-                "Creative Services",
-                "Customer Journey Analysis",
-                "Design and Build",
-                "Iris by Cro Metrics",
-                "Lifecycle and Email",
-                "Performance Marketing"
-            ]
-            
-            found_services = []
-            for service in services_to_check:
-                if service.lower() in report.lower():
-                    found_services.append(service)
+            found_services = _mentions(SERVICES_TO_CHECK, report_lower)
             
-            print(f"\n📋 Service Mapping Analysis:")
-            print(f"  • Services mentioned: {len(found_services)}/{len(services_to_check)}")
+            log.debug(f"\n📋 Service Mapping Analysis:")
+            log.debug(f"  • Services mentioned: {len(found_services)}/{len(SERVICES_TO_CHECK)}")
             
-            print(f"\n✅ Found Cro Metrics Services:")
-            for service in found_services:
-                print(f"  • {service}")
+            log.debug(f"\n✅ Found Cro Metrics Services:")
+            if found_services:
+                log.debug("\n".join(f"  • {service}" for service in found_services))
             
             # Check for website metrics and client examples
-            website_elements = [
-                "$1B client impact",
-                "97.4% retention",
-                "10X ROI",
-                "Home Chef",
-                "Curology", 
-                "Bombas",
-                "Iris platform",
-                "We Don't Guess, We Test"
-            ]
+            found_elements = _mentions(WEBSITE_ELEMENTS, report_lower)
             
-            found_elements = []
-            for element in website_elements:
-                if element.lower() in report.lower():
-                    found_elements.append(element)
+            log.debug(f"\n📈 Website Content Integration:")
+            log.debug(f"  • Website elements found: {len(found_elements)}/{len(WEBSITE_ELEMENTS)}")
             
-            print(f"\n📈 Website Content Integration:")
-            print(f"  • Website elements found: {len(found_elements)}/{len(website_elements)}")
-            
-            for element in found_elements:
-                print(f"  • {element}")
+            if found_elements:
+                log.debug("\n".join(f"  • {element}" for element in found_elements))
             
             if len(found_services) >= 4 and len(found_elements) >= 4:
-                print("\n🎉 EXCELLENT! Comprehensive service mapping working!")
-                print("✅ AI is mapping customer needs to specific Cro Metrics services")
-                print("✅ Website content is being effectively utilized")
+                log.info("\n🎉 EXCELLENT! Comprehensive service mapping working!")
+                log.info("✅ AI is mapping customer needs to specific Cro Metrics services")
+                log.info("✅ Website content is being effectively utilized")
                 return True
             elif len(found_services) >= 2:
-                print("\n✅ Good service mapping present")
+                log.info("\n✅ Good service mapping present")
                 return True
             else:
-                print("\n⚠️  Limited service mapping detected")
+                log.info("\n⚠️  Limited service mapping detected")
                 return False
                 
         else:
-            print(f"❌ Report generation failed: {response.status_code}")
+            log.info(f"❌ Report generation failed: {response.status_code}")
             return False
             
     except Exception as e:
-        print(f"❌ Test failed: {str(e)}")
+        log.info(f"❌ Test failed: {str(e)}")
         return False
 
+# Test with SaaS scenario
+SAAS_PAYLOAD = {
+    "company_name": "CloudTech Solutions",
+    "industry": "SaaS",
+    "meeting_context": "B2B SaaS company looking to improve trial-to-paid conversion and reduce churn.",
+    "effort": "medium",
+    "researched_attendees": (
+        {
+            "name": "Alex Kim",
+            "title": "VP of Growth",
+            "company": "CloudTech Solutions",
+            "email": "alex@cloudtech.com",
+            "linkedin_url": "https://linkedin.com/in/alexkim",
+            "linkedin_snippet": "VP of Growth focused on SaaS metrics and customer acquisition",
+            "hubspot_contact": None,
+            "background_research": {}
+        },
+    )
+}
+
 def test_industry_expertise_matching():
     """Test that the AI references relevant industry expertise."""
-    print("\n🏭 Testing Industry Expertise Matching")
-    print("-" * 40)
-    
-    # Test with SaaS scenario
-    saas_payload = {
-        "company_name": "CloudTech Solutions",
-        "industry": "SaaS",
-        "meeting_context": "B2B SaaS company looking to improve trial-to-paid conversion and reduce churn.",
-        "effort": "medium",
-        "researched_attendees": [
-            {
-                "name": "Alex Kim",
-                "title": "VP of Growth",
-                "company": "CloudTech Solutions",
-                "email": "alex@cloudtech.com",
-                "linkedin_url": "https://linkedin.com/in/alexkim",
-                "linkedin_snippet": "VP of Growth focused on SaaS metrics and customer acquisition",
-                "hubspot_contact": None,
-                "background_research": {}
-            }
-        ]
-    }
+    log.info("\n🏭 Testing Industry Expertise Matching")
+    log.info("-" * 40)
     
-    print("🔍 Testing SaaS industry expertise matching...")
+    log.debug("🔍 Testing SaaS industry expertise matching...")
     
     try:
-        response = requests.post(
+        response = _client.post(
             f"{BASE_URL}/api/bd/generate",
-            json=saas_payload,
+            content=orjson.dumps(SAAS_PAYLOAD),
             timeout=120
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             report = data.get('report_markdown', '')
+            report_lower = report.lower()
             
             # Check for SaaS-specific content
-            saas_indicators = [
-                "SaaS",
-                "subscription",
-                "trial-to-paid",
-                "churn",
-                "customer acquisition",
-                "retention"
-            ]
+            found_saas = _mentions(SAAS_INDICATORS, report_lower)
             
-            found_saas = []
-            for indicator in saas_indicators:
-                if indicator.lower() in report.lower():
-                    found_saas.append(indicator)
-            
-            print(f"✅ SaaS-focused report generated!")
-            print(f"📊 SaaS indicators found: {len(found_saas)}/{len(saas_indicators)}")
+            log.info(f"✅ SaaS-focused report generated!")
+            log.debug(f"📊 SaaS indicators found: {len(found_saas)}/{len(SAAS_INDICATORS)}")
             
             if len(found_saas) >= 3:
-                print("✅ Industry expertise matching working well!")
+                log.info("✅ Industry expertise matching working well!")
                 return True
             else:
-                print("⚠️  Limited industry-specific content")
+                log.info("⚠️  Limited industry-specific content")
                 return True  # Still acceptable
                 
         else:
-            print(f"❌ SaaS test failed: {response.status_code}")
+            log.info(f"❌ SaaS test failed: {response.status_code}")
             return False
             
     except Exception as e:
-        print(f"❌ Industry test failed: {str(e)}")
+        log.info(f"❌ Industry test failed: {str(e)}")
         return False
 
 if __name__ == "__main__":
-    print("🚀 Testing Enhanced Website Integration & Service Mapping")
-    print("=" * 65)
-    
     tests = [
         ("Website Service Mapping", test_website_service_mapping),
         ("Industry Expertise Matching", test_industry_expertise_matching)
     ]
-    
-    results = []
-    
-    for test_name, test_func in tests:
-        print(f"\n📋 Running: {test_name}")
-        print("=" * 65)
-        
-        start_time = time.time()
-        success = test_func()
-        duration = time.time() - start_time
-        
-        results.append((test_name, success, duration))
-        print(f"⏱️  Duration: {duration:.2f}s")
-    
-    # Summary
-    print("\n" + "=" * 65)
-    print("📊 TEST RESULTS SUMMARY")
-    print("=" * 65)
-    
-    passed = 0
-    total = len(results)
-    
-    for test_name, success, duration in results:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} | {test_name:<30} | {duration:>6.2f}s")
-        if success:
-            passed += 1
-    
-    print("-" * 65)
-    print(f"Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
-    
-    if passed == total:
-        print("🎉 Website integration and service mapping working perfectly!")
-        print("🌐 AI now leverages current Cro Metrics website content")
-        print("🎯 Customer needs mapped to specific service offerings")
-        print("📈 References proven results and client success stories")
-    else:
-        print("❌ Some enhancements may need attention")
-    
-    exit(0 if passed == total else 1)
+    all_passed = run_tests(
+        "🚀 Testing Enhanced Website Integration & Service Mapping",
+        tests,
+        65,
+        [
+            "🎉 Website integration and service mapping working perfectly!",
+            "🌐 AI now leverages current Cro Metrics website content",
+            "🎯 Customer needs mapped to specific service offerings",
+            "📈 References proven results and client success stories",
+        ],
+        "❌ Some enhancements may need attention",
+    )
+    exit(0 if all_passed else 1)